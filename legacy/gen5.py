@@ -83,14 +83,16 @@ import random
 from dataclasses import dataclass, field
 from typing import Dict, List, Callable, Any, Optional, Union, Tuple
 from collections import defaultdict
+from functools import lru_cache
 import re
+import sys
 
 
 # =============================================================================
 # CORE DATA STRUCTURES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """A story character with mutable emotional state."""
     name: str
@@ -107,6 +109,15 @@ class Character:
     # For pronoun resolution
     pronouns: Tuple[str, str, str] = ("they", "them", "their")
     
+    # What the character is looking for / at (set by Seek and Look in k08)
+    Focus: Optional[str] = None
+    
+    def __post_init__(self):
+        # Names are dict keys in StoryContext.characters and get compared and
+        # re-embedded in every fragment; interning makes those identity hits.
+        if isinstance(self.name, str):
+            self.name = sys.intern(self.name)
+    
     def __repr__(self):
         return self.name
     
@@ -124,9 +135,14 @@ class Character:
     def his(self): return self.pronouns[2]
 
 
-@dataclass 
+@dataclass(slots=True)
 class StoryFragment:
-    """A piece of generated text with metadata."""
+    """
+    A piece of generated text with metadata.
+    
+    Slotted: every kernel branch builds one, so skipping the per-instance
+    __dict__ keeps construction cheap and the fragments small.
+    """
     text: str
     weight: float = 1.0  # Attention weight (reduced by / operator)
     kernel_name: str = ""
@@ -148,7 +164,7 @@ class StoryFragment:
         return StoryFragment(self.text, self.weight / divisor, self.kernel_name)
 
 
-@dataclass
+@dataclass(slots=True)
 class StoryContext:
     """Execution context for story generation."""
     characters: Dict[str, Character] = field(default_factory=dict)
@@ -560,29 +576,7 @@ class KernelRegistry:
             
             # Detect duplicate kernel registrations
             if kernel_name in self.kernels:
-                import inspect
-                existing_func = self.kernels[kernel_name]
-                existing_file = inspect.getsourcefile(existing_func)
-                new_file = inspect.getsourcefile(func)
-                print(f"⚠️  WARNING: Duplicate kernel '{kernel_name}'")
-                print(f"   Already registered in: {existing_file}")
-                print(f"   Overwriting with: {new_file}")
-                
-                if self.show_duplicate_source:
-                    try:
-                        existing_source = inspect.getsource(existing_func)
-                        new_source = inspect.getsource(func)
-                        print(f"\n   === EXISTING ({existing_file}) ===")
-                        print("   " + "\n   ".join(existing_source.split('\n')[:20]))  # First 20 lines
-                        if existing_source.count('\n') > 20:
-                            print(f"   ... ({existing_source.count(chr(10)) - 20} more lines)")
-                        print(f"\n   === NEW ({new_file}) ===")
-                        print("   " + "\n   ".join(new_source.split('\n')[:20]))  # First 20 lines
-                        if new_source.count('\n') > 20:
-                            print(f"   ... ({new_source.count(chr(10)) - 20} more lines)")
-                        print()
-                    except Exception as e:
-                        print(f"   (Could not retrieve source: {e})")
+                self._warn_duplicate(kernel_name, func)
             
             self.kernels[kernel_name] = func
             self.metadata[kernel_name] = {
@@ -596,6 +590,47 @@ class KernelRegistry:
             return func
         return decorator
     
+    def register_table(self, table: List[Tuple[str, Callable]]):
+        """
+        Register a pack's (name, function) pairs in one pass.
+        
+        Same bookkeeping as the @kernel decorator (duplicate warning, metadata),
+        without building a decorator closure per kernel at import time.
+        """
+        kernels = self.kernels
+        metadata = self.metadata
+        for kernel_name, func in table:
+            if kernel_name in kernels:
+                self._warn_duplicate(kernel_name, func)
+            kernels[kernel_name] = func
+            metadata[kernel_name] = {'verb': kernel_name.lower(), 'doc': func.__doc__}
+    
+    def _warn_duplicate(self, kernel_name: str, func: Callable):
+        """Report a kernel name that is about to be overwritten."""
+        import inspect
+        existing_func = self.kernels[kernel_name]
+        existing_file = inspect.getsourcefile(existing_func)
+        new_file = inspect.getsourcefile(func)
+        print(f"⚠️  WARNING: Duplicate kernel '{kernel_name}'")
+        print(f"   Already registered in: {existing_file}")
+        print(f"   Overwriting with: {new_file}")
+        
+        if self.show_duplicate_source:
+            try:
+                existing_source = inspect.getsource(existing_func)
+                new_source = inspect.getsource(func)
+                print(f"\n   === EXISTING ({existing_file}) ===")
+                print("   " + "\n   ".join(existing_source.split('\n')[:20]))  # First 20 lines
+                if existing_source.count('\n') > 20:
+                    print(f"   ... ({existing_source.count(chr(10)) - 20} more lines)")
+                print(f"\n   === NEW ({new_file}) ===")
+                print("   " + "\n   ".join(new_source.split('\n')[:20]))  # First 20 lines
+                if new_source.count('\n') > 20:
+                    print(f"   ... ({new_source.count(chr(10)) - 20} more lines)")
+                print()
+            except Exception as e:
+                print(f"   (Could not retrieve source: {e})")
+    
     def get(self, name: str) -> Optional[Callable]:
         return self.kernels.get(name)
     
@@ -1748,6 +1783,101 @@ def kernel_reassure(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
 # HELPER FUNCTIONS
 # =============================================================================
 
+def _split_args(args) -> Tuple[List[Character], list]:
+    """
+    Partition kernel args into (characters, everything else) in one pass.
+    
+    Equivalent to the two comprehensions kernels traditionally open with,
+    but walks args once. Character is never subclassed, so an exact type
+    check stands in for isinstance and skips the MRO walk.
+    """
+    chars = []
+    non_chars = []
+    for a in args:
+        if type(a) is Character:
+            chars.append(a)
+        else:
+            non_chars.append(a)
+    return chars, non_chars
+
+
+def _split_chars_strs(args) -> Tuple[List[Character], List[str]]:
+    """
+    Partition kernel args into (characters, plain-string objects) in one pass.
+    
+    For packs whose objects are only the bare-word string args (k13, k14);
+    fragments, lists and None are dropped, as their comprehensions did.
+    """
+    chars = []
+    strs = []
+    for a in args:
+        t = type(a)
+        if t is Character:
+            chars.append(a)
+        elif t is str:
+            strs.append(a)
+    return chars, strs
+
+
+def _chars_only(args) -> List[Character]:
+    """The Character args, for kernels that never look at the other ones."""
+    return [a for a in args if type(a) is Character]
+
+
+def _two_chars(args) -> Tuple[Optional[Character], Optional[Character]]:
+    """First two Character args (None where missing), for actor/target kernels."""
+    first = None
+    for a in args:
+        if type(a) is Character:
+            if first is None:
+                first = a
+            else:
+                return first, a
+    return first, None
+
+
+def _first_char_and_other(args) -> Tuple[Optional[Character], bool, Any]:
+    """
+    Return (first Character, whether any non-Character arg exists, first one).
+    
+    For kernels that only ever look at chars[0] / non_chars[0]: no lists are
+    built and the scan stops once both are found. The explicit flag matters
+    because None is a legitimate argument (unsupported AST nodes evaluate to
+    None), so the "other" slot cannot double as the missing marker.
+    """
+    first_char = None
+    has_other = False
+    first_other = None
+    for a in args:
+        if type(a) is Character:
+            if first_char is None:
+                first_char = a
+                if has_other:
+                    break
+        elif not has_other:
+            has_other = True
+            first_other = a
+            if first_char is not None:
+                break
+    return first_char, has_other, first_other
+
+
+def _name(x: Any) -> str:
+    """Display name of a kernel argument: a Character's name, else str(x)."""
+    return x.name if type(x) is Character else str(x)
+
+
+def _join_names(names: List[str]) -> str:
+    """NLGUtils.join_list with the one- to three-name cases inlined."""
+    n = len(names)
+    if n == 1:
+        return names[0]
+    if n == 2:
+        return names[0] + " and " + names[1]
+    if n == 3:
+        return names[0] + ", " + names[1] + ", and " + names[2]
+    return NLGUtils.join_list(names)
+
 def _get_default_actor(ctx: StoryContext, explicit_chars: list) -> Optional[Character]:
     """
     Get the default actor for an action kernel.
@@ -1764,9 +1894,10 @@ def _get_default_actor(ctx: StoryContext, explicit_chars: list) -> Optional[Char
     # Prefer first character (usually protagonist) over current_focus
     # This is because current_focus gets set to the last-defined character,
     # but the first character is usually the subject of the story
-    if ctx.characters:
-        first_char = list(ctx.characters.values())[0]
-        return first_char
+    # (read straight off the dict rather than copying every value)
+    characters = ctx.characters
+    if characters:
+        return next(iter(characters.values()))
     
     # Fallback to current focus if no characters defined yet
     return ctx.current_focus
@@ -1774,18 +1905,17 @@ def _get_default_actor(ctx: StoryContext, explicit_chars: list) -> Optional[Char
 
 def _to_phrase(value) -> str:
     """Convert various types to natural language phrase."""
+    if type(value) is str:
+        # Most kernel arguments are plain tokens; go straight to the cache
+        return _to_phrase_cached(value)
     if isinstance(value, StoryFragment):
         text = value.text
         # Remove trailing period for embedding in sentences
         return text.rstrip('.!?')
-    if isinstance(value, Character):
+    if type(value) is Character:
         return value.name
     if isinstance(value, str):
-        # Handle kernel-like strings (CamelCase -> words)
-        phrase = re.sub(r'([a-z])([A-Z])', r'\1 \2', value)
-        # Handle snake_case
-        phrase = phrase.replace('_', ' ')
-        return phrase.lower()
+        return _to_phrase_cached(value)
     if isinstance(value, (list, tuple)):
         return NLGUtils.join_list([_to_phrase(v) for v in value])
     if value is None:
@@ -1793,6 +1923,22 @@ def _to_phrase(value) -> str:
     return str(value).lower()
 
 
+@lru_cache(maxsize=4096)
+def _to_phrase_cached(value: str) -> str:
+    """
+    String branch of _to_phrase, memoized.
+    
+    Kernels see the same handful of concept tokens ("tree", "park", "RunAway")
+    story after story. Only strings are cached: StoryFragment and Character
+    are unhashable dataclasses and lists are mutable.
+    """
+    # Handle kernel-like strings (CamelCase -> words)
+    phrase = re.sub(r'([a-z])([A-Z])', r'\1 \2', value)
+    # Handle snake_case
+    phrase = phrase.replace('_', ' ')
+    return phrase.lower()
+
+
 # Mapping of kernel names to state descriptions
 STATE_MAPPINGS = {
     'routine': 'going about the day',
@@ -1928,28 +2074,47 @@ def _extract_state(text: str) -> str:
 
 def _event_to_phrase(value) -> str:
     """Convert an event/catalyst to a phrase suitable for 'One day, X.'"""
+    if type(value) is str:
+        return _event_phrase_cached(value)
     if isinstance(value, StoryFragment):
-        text = value.text.rstrip('.!?')
-        # Make it flow as an event
-        if text.startswith('There was '):
-            text = text[10:]  # Remove "There was "
-        # If it's a noun phrase (like "a grumpy dog"), add verb
-        words = text.split()
-        if words and not any(w in text.lower() for w in ['was', 'is', 'were', 'came', 'appeared', 'arrived', 'happened']):
-            # Check if it looks like just a noun/adjective phrase
-            if len(words) <= 4 and not text[0].isupper():
-                return f"there was {text}"
-            elif len(words) <= 4:
-                return f"{text} appeared"
-        return text
+        return _event_phrase_from_text(value.text)
     
     if isinstance(value, str):
-        phrase = re.sub(r'([a-z])([A-Z])', r'\1 \2', value).lower()
-        return f"something {phrase} happened"
+        return _event_phrase_cached(value)
     
     return _to_phrase(value)
 
 
+@lru_cache(maxsize=2048)
+def _event_phrase_cached(value: str) -> str:
+    """String branch of _event_to_phrase, memoized like _to_phrase_cached."""
+    phrase = re.sub(r'([a-z])([A-Z])', r'\1 \2', value).lower()
+    return f"something {phrase} happened"
+
+
+@lru_cache(maxsize=2048)
+def _event_phrase_from_text(text: str) -> str:
+    """
+    StoryFragment branch of _event_to_phrase, keyed on the fragment's text.
+    
+    Fragments themselves are unhashable, but the phrase depends only on
+    their text, and the same sub-events recur across a batch of stories.
+    """
+    text = text.rstrip('.!?')
+    # Make it flow as an event
+    if text.startswith('There was '):
+        text = text[10:]  # Remove "There was "
+    # If it's a noun phrase (like "a grumpy dog"), add verb
+    words = text.split()
+    if words and not any(w in text.lower() for w in ['was', 'is', 'were', 'came', 'appeared', 'arrived', 'happened']):
+        # Check if it looks like just a noun/adjective phrase
+        if len(words) <= 4 and not text[0].isupper():
+            return f"there was {text}"
+        elif len(words) <= 4:
+            return f"{text} appeared"
+    return text
+
+
 def _action_to_phrase(value) -> str:
     """Convert an action/process to a verb phrase."""
     if isinstance(value, StoryFragment):
@@ -2196,8 +2361,8 @@ class KernelExecutor:
             return StoryFragment(intro, kernel_name="Character")
         
         # Lookup and execute kernel
-        if func_name in self.registry:
-            kernel_func = self.registry.get(func_name)
+        kernel_func = self.registry.kernels.get(func_name)
+        if kernel_func is not None:
             try:
                 result = kernel_func(self.ctx, *args, **kwargs)
                 if isinstance(result, StoryFragment):
@@ -32,6 +32,8 @@ KERNELS IN THIS PACK (with usage patterns from sampling):
 
 """
 
+from typing import Callable
+
 from gen5 import (
     REGISTRY,
     StoryContext,
@@ -43,6 +45,79 @@ from gen5 import (
     _get_default_actor,
 )
 
+# Concept-mode fragments with no dynamic parts. Fragments are never mutated
+# after construction (composition and `/` build new ones), so these returns
+# can share a single instance instead of allocating on every call.
+_HEAR_CONCEPT = StoryFragment("hearing", kernel_name="Hear")
+_STOP_CONCEPT = StoryFragment("stopped", kernel_name="Stop")
+_RECALL_CONCEPT = StoryFragment("remembering", kernel_name="Recall")
+_CONTINUATION_CONCEPT = StoryFragment("continuing", kernel_name="Continuation")
+_MATCHES_DANGER_CONCEPT = StoryFragment("the danger of playing with matches", kernel_name="MatchesDanger")
+_WATER_CONCEPT = StoryFragment("water", kernel_name="Water")
+
+# =============================================================================
+# KERNEL FACTORIES
+# =============================================================================
+
+def make_mood_kernel(name: str, mood: str, delta: float, past: str, gerund: str,
+                     bare: str, concept: str, doc: str) -> Callable[..., StoryFragment]:
+    """
+    Build a single-actor kernel that nudges one emotion and names its object.
+
+    Enjoy/Choose/Disregard only differ in these slots, so they share one body:
+      - with actor + object:  "{name} {past} {object}."
+      - with actor only:      "{name} {bare}."
+      - concept + object:     "{gerund} {object}"
+      - bare concept:         "{concept}"
+    """
+    concept_frag = StoryFragment(concept, kernel_name=name)
+
+    def kernel(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+        chars = [a for a in args if isinstance(a, Character)]
+        objects = [str(a) for a in args if not isinstance(a, Character)]
+
+        char = _get_default_actor(ctx, chars)
+
+        if char:
+            setattr(char, mood, getattr(char, mood) + delta)
+            if objects:
+                thing = _to_phrase(objects[0])
+                return StoryFragment(f"{char.name} {past} {thing}.")
+            return StoryFragment(f"{char.name} {bare}.")
+
+        # No character - used as concept
+        if objects:
+            thing = _to_phrase(objects[0])
+            return StoryFragment(f"{gerund} {thing}", kernel_name=name)
+
+        return concept_frag
+
+    kernel.__name__ = kernel.__qualname__ = f"kernel_{name.lower()}"
+    kernel.__doc__ = doc
+    return kernel
+
+
+def make_pretend_kernel(name: str, role: str, doc: str) -> Callable[..., StoryFragment]:
+    """Build a pretend-play kernel: every character present plays `role`."""
+    played = f" pretended to be {role}."
+    concept_frag = StoryFragment(f"playing {role}", kernel_name=name)
+
+    def kernel(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+        chars = [a for a in args if isinstance(a, Character)]
+
+        if chars:
+            for char in chars:
+                char.Joy += 10
+            names = NLGUtils.join_list([c.name for c in chars])
+            return StoryFragment(names + played)
+
+        return concept_frag
+
+    kernel.__name__ = kernel.__qualname__ = f"kernel_{name.lower()}"
+    kernel.__doc__ = doc
+    return kernel
+
+
 # =============================================================================
 # ACTION KERNELS
 # =============================================================================
@@ -74,11 +149,11 @@ def kernel_hear(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         sound = _to_phrase(objects[0])
         return StoryFragment(f"hearing {sound}", kernel_name="Hear")
     
-    return StoryFragment("hearing", kernel_name="Hear")
+    return _HEAR_CONCEPT
 
 
 @REGISTRY.kernel("Stop")
-def kernel_stop(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_stop(ctx: StoryContext, *args, action=None, **kwargs) -> StoryFragment:
     """
     Stopping an action or activity.
     
@@ -89,7 +164,6 @@ def kernel_stop(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     chars = [a for a in args if isinstance(a, Character)]
     objects = [str(a) for a in args if not isinstance(a, Character)]
-    action = kwargs.get('action', None)
     
     char = _get_default_actor(ctx, chars)
     
@@ -107,41 +181,25 @@ def kernel_stop(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         thing = _to_phrase(objects[0])
         return StoryFragment(f"stopping {thing}", kernel_name="Stop")
     
-    return StoryFragment("stopped", kernel_name="Stop")
+    return _STOP_CONCEPT
 
 
-@REGISTRY.kernel("Choose")
-def kernel_choose(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
+kernel_choose = REGISTRY.kernel("Choose")(make_mood_kernel(
+    "Choose", "Joy", 3,  # Small positive for making a decision
+    past="chose", gerund="choosing", bare="made a choice", concept="a choice",
+    doc="""
     Choosing or selecting something.
     
     Patterns from sampling:
       - Choose(candle, scent=flower) -- choosing a specific item
       - Choose(cheap)                -- choosing the cheap option
       - Choose(Lily, Wash(dishes))   -- character choosing an action
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if not isinstance(a, Character)]
-    
-    char = _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 3  # Small positive for making a decision
-        if objects:
-            choice = _to_phrase(objects[0])
-            return StoryFragment(f"{char.name} chose {choice}.")
-        return StoryFragment(f"{char.name} made a choice.")
-    
-    # No character - used as concept
-    if objects:
-        choice = _to_phrase(objects[0])
-        return StoryFragment(f"choosing {choice}", kernel_name="Choose")
-    
-    return StoryFragment("a choice", kernel_name="Choose")
+    """,
+))
 
 
 @REGISTRY.kernel("Recall")
-def kernel_recall(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_recall(ctx: StoryContext, *args, advice=None, past=None, **kwargs) -> StoryFragment:
     """
     Remembering or recalling something.
     
@@ -152,8 +210,6 @@ def kernel_recall(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     chars = [a for a in args if isinstance(a, Character)]
     objects = [str(a) for a in args if not isinstance(a, Character)]
-    advice = kwargs.get('advice', None)
-    past = kwargs.get('past', None)
     
     char = _get_default_actor(ctx, chars)
     
@@ -174,74 +230,42 @@ def kernel_recall(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         thing = _to_phrase(objects[0])
         return StoryFragment(f"recalling {thing}", kernel_name="Recall")
     
-    return StoryFragment("remembering", kernel_name="Recall")
+    return _RECALL_CONCEPT
 
 
-@REGISTRY.kernel("Disregard")
-def kernel_disregard(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
+kernel_disregard = REGISTRY.kernel("Disregard")(make_mood_kernel(
+    "Disregard", "Anger", 3,  # Slight increase in impulsiveness/defiance
+    past="disregarded", gerund="disregarding", bare="ignored the warning", concept="disregard",
+    doc="""
     Ignoring or disregarding advice/warnings.
     
     Patterns from sampling:
       - Disregard(Tom)               -- Tom disregards warning
       - Conflict(Nervous(Lily) + Disregard(Tom))  -- tension from disregarding
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if not isinstance(a, Character)]
-    
-    char = _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Anger += 3  # Slight increase in impulsiveness/defiance
-        if objects:
-            thing = _to_phrase(objects[0])
-            return StoryFragment(f"{char.name} disregarded {thing}.")
-        return StoryFragment(f"{char.name} ignored the warning.")
-    
-    # No character - used as concept
-    if objects:
-        thing = _to_phrase(objects[0])
-        return StoryFragment(f"disregarding {thing}", kernel_name="Disregard")
-    
-    return StoryFragment("disregard", kernel_name="Disregard")
+    """,
+))
 
 
 # =============================================================================
 # EMOTION/EXPERIENCE KERNELS
 # =============================================================================
 
-@REGISTRY.kernel("Enjoy")
-def kernel_enjoy(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
+kernel_enjoy = REGISTRY.kernel("Enjoy")(make_mood_kernel(
+    "Enjoy", "Joy", 8,
+    past="enjoyed", gerund="enjoying", bare="enjoyed it", concept="enjoyment",
+    doc="""
     Enjoying something.
     
     Patterns from sampling:
       - Enjoy(peach)                 -- enjoying eating something
       - Enjoy(Lily, Lemonade)        -- character enjoying something
       - Enjoy + Safe                 -- enjoying the park (safe to enjoy)
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if not isinstance(a, Character)]
-    
-    char = _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 8
-        if objects:
-            thing = _to_phrase(objects[0])
-            return StoryFragment(f"{char.name} enjoyed {thing}.")
-        return StoryFragment(f"{char.name} enjoyed it.")
-    
-    # No character - used as concept
-    if objects:
-        thing = _to_phrase(objects[0])
-        return StoryFragment(f"enjoying {thing}", kernel_name="Enjoy")
-    
-    return StoryFragment("enjoyment", kernel_name="Enjoy")
+    """,
+))
 
 
 @REGISTRY.kernel("Continuation")
-def kernel_continuation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_continuation(ctx: StoryContext, *args, action=None, state=None, **kwargs) -> StoryFragment:
     """
     Continuing an activity or action.
     
@@ -252,8 +276,6 @@ def kernel_continuation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     chars = [a for a in args if isinstance(a, Character)]
     objects = [str(a) for a in args if not isinstance(a, Character)]
-    action = kwargs.get('action', None)
-    state = kwargs.get('state', None)
     
     char = _get_default_actor(ctx, chars)
     
@@ -271,50 +293,34 @@ def kernel_continuation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         activity = _to_phrase(objects[0])
         return StoryFragment(f"continuing {activity}", kernel_name="Continuation")
     
-    return StoryFragment("continuing", kernel_name="Continuation")
+    return _CONTINUATION_CONCEPT
 
 
 # =============================================================================
 # STORY/PLAY KERNELS
 # =============================================================================
 
-@REGISTRY.kernel("Pirates")
-def kernel_pirates(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
+kernel_pirates = REGISTRY.kernel("Pirates")(make_pretend_kernel(
+    "Pirates", "pirates",
+    doc="""
     Pretend play as pirates.
     
     Patterns from sampling:
       - Play(Pirates, Explorers, Lily, Tom)    -- playing pirates
       - Transformation(Play(Pirates) + SafeLight)  -- continuing pirate play
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    if chars:
-        for char in chars:
-            char.Joy += 10
-        names = NLGUtils.join_list([c.name for c in chars])
-        return StoryFragment(f"{names} pretended to be pirates.")
-    
-    return StoryFragment("playing pirates", kernel_name="Pirates")
+    """,
+))
 
 
-@REGISTRY.kernel("Explorers")
-def kernel_explorers(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
+kernel_explorers = REGISTRY.kernel("Explorers")(make_pretend_kernel(
+    "Explorers", "explorers",
+    doc="""
     Pretend play as explorers.
     
     Patterns from sampling:
       - Play(Pirates, Explorers, Lily, Tom)    -- playing explorers
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    if chars:
-        for char in chars:
-            char.Joy += 10
-        names = NLGUtils.join_list([c.name for c in chars])
-        return StoryFragment(f"{names} pretended to be explorers.")
-    
-    return StoryFragment("playing explorers", kernel_name="Explorers")
+    """,
+))
 
 
 # =============================================================================
@@ -329,7 +335,7 @@ def kernel_matches_danger(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     Patterns from sampling:
       - Lesson(MatchesDanger)    -- learning about match danger
     """
-    return StoryFragment("the danger of playing with matches", kernel_name="MatchesDanger")
+    return _MATCHES_DANGER_CONCEPT
 
 
 @REGISTRY.kernel("SafeLight")
@@ -391,7 +397,7 @@ def kernel_water(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if container:
         return StoryFragment(f"water in a {container}", kernel_name="Water")
     
-    return StoryFragment("water", kernel_name="Water")
+    return _WATER_CONCEPT
 
 
 # =============================================================================
@@ -39,6 +39,8 @@ All kernels follow the standard pattern:
 - Include comprehensive docstrings with pattern examples
 """
 
+from typing import Any, Callable, Dict, List, Tuple
+
 from gen5 import (
     REGISTRY,
     StoryContext,
@@ -47,17 +49,59 @@ from gen5 import (
     NLGUtils,
     _to_phrase,
     _get_default_actor,
+    _split_args,
+    _chars_only,
+    _two_chars,
+    _first_char_and_other,
+    _name,
+    _join_names,
 )
 
+# Bound once; Choice/Join inline the common two-item case ("a and b") and
+# only fall back to the general Oxford-comma join for longer lists.
+_join = NLGUtils.join_list
+
+
+# Constant "no character" returns, built once and shared between calls
+_GOAL_CONCEPT = StoryFragment("a goal", kernel_name="Goal")
+_INQUIRY_CONCEPT = StoryFragment("there was a question", kernel_name="Inquiry")
+_CHOICE_CONCEPT = StoryFragment("a choice", kernel_name="Choice")
+_UPSET_CONCEPT = StoryFragment("there was distress", kernel_name="Upset")
+_RECEIVE_CONCEPT = StoryFragment("receiving something", kernel_name="Receive")
+_DISRUPTION_CONCEPT = StoryFragment("there was a disruption", kernel_name="Disruption")
+_TASK_CONCEPT = StoryFragment("there was a task", kernel_name="Task")
+_ANSWER_CONCEPT = StoryFragment("there was an answer", kernel_name="Answer")
+_FILL_CONCEPT = StoryFragment("filling", kernel_name="Fill")
+_JOIN_CONCEPT = StoryFragment("joining together", kernel_name="Join")
+_FAREWELL_CONCEPT = StoryFragment("saying goodbye", kernel_name="Farewell")
+_GRANT_CONCEPT = StoryFragment("a grant", kernel_name="Grant")
+_TEMPTATION_CONCEPT = StoryFragment("there was temptation", kernel_name="Temptation")
+_CRISIS_CONCEPT = StoryFragment("there was a crisis", kernel_name="Crisis")
+_COMMAND_CONCEPT = StoryFragment("a command", kernel_name="Command")
+_CHEER_CONCEPT = StoryFragment("there was cheering", kernel_name="Cheer")
+_SAVE_CONCEPT = StoryFragment("a rescue", kernel_name="Save")
+_KISS_CONCEPT = StoryFragment("a kiss", kernel_name="Kiss")
+_MEETING_CONCEPT = StoryFragment("there was a meeting", kernel_name="Meeting")
+_ENCOURAGEMENT_CONCEPT = StoryFragment("encouragement", kernel_name="Encouragement")
+_SEPARATION_CONCEPT = StoryFragment("separation", kernel_name="Separation")
+_CONFRONTATION_CONCEPT = StoryFragment("a confrontation", kernel_name="Confrontation")
+_HIDESEEK_CONCEPT = StoryFragment("playing hide and seek", kernel_name="HideSeek")
+_TRANSPORT_CONCEPT = StoryFragment("transporting", kernel_name="Transport")
+_TRICK_CONCEPT = StoryFragment("a trick", kernel_name="Trick")
+_ONGOING_CONCEPT = StoryFragment("it continued", kernel_name="Ongoing")
+_INTERACTION_CONCEPT = StoryFragment("an interaction", kernel_name="Interaction")
+_SUGGESTION_CONCEPT = StoryFragment("a suggestion", kernel_name="Suggestion")
+_MISS_CONCEPT = StoryFragment("missing someone", kernel_name="Miss")
+_FIGHT_CONCEPT = StoryFragment("a fight", kernel_name="Fight")
+_REMINDER_CONCEPT = StoryFragment("a reminder", kernel_name="Reminder")
+
 
-@REGISTRY.kernel("Goal")
 def kernel_goal(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Represents an objective, destination, or intention.
     Can be a character's goal or an abstract goal.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     if chars:
         char = chars[0]
@@ -73,11 +117,10 @@ def kernel_goal(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         goal = _to_phrase(non_chars[0])
         return StoryFragment(f"The goal was to reach {goal}.", kernel_name="Goal")
     
-    return StoryFragment("a goal", kernel_name="Goal")
+    return _GOAL_CONCEPT
 
 
-@REGISTRY.kernel("Inquiry")
-def kernel_inquiry(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_inquiry(ctx: StoryContext, *args, to=None, item=None, **kwargs) -> StoryFragment:
     """
     Asking questions about something or someone.
     
@@ -85,11 +128,7 @@ def kernel_inquiry(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Inquiry(char, item, to=other) -- asking someone about something
       - Inquiry(char, item) -- asking about something
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    to = kwargs.get('to', None)
-    item = kwargs.get('item', None)
+    chars, non_chars = _split_args(args)
     
     if chars:
         char = chars[0]
@@ -99,19 +138,16 @@ def kernel_inquiry(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         if to:
             if item:
                 item_phrase = _to_phrase(item)
-                to_name = to.name if isinstance(to, Character) else str(to)
-                return StoryFragment(f"{char.name} asked {to_name} about the {item_phrase}.")
+                return StoryFragment(f"{char.name} asked {_name(to)} about the {item_phrase}.")
             elif non_chars:
                 other_char = chars[1] if len(chars) > 1 else None
                 thing = _to_phrase(non_chars[0])
                 if other_char:
                     return StoryFragment(f"{char.name} asked {other_char.name} about the {thing}.")
                 else:
-                    to_name = to.name if isinstance(to, Character) else str(to)
-                    return StoryFragment(f"{char.name} asked {to_name} about {thing}.")
+                    return StoryFragment(f"{char.name} asked {_name(to)} about {thing}.")
             else:
-                to_name = to.name if isinstance(to, Character) else str(to)
-                return StoryFragment(f"{char.name} asked {to_name} a question.")
+                return StoryFragment(f"{char.name} asked {_name(to)} a question.")
         
         # Simple inquiry about something
         if item:
@@ -128,10 +164,9 @@ def kernel_inquiry(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f"{char.name} asked a question.")
     
     # No character - inquiry as concept
-    return StoryFragment("there was a question", kernel_name="Inquiry")
+    return _INQUIRY_CONCEPT
 
 
-@REGISTRY.kernel("Choice")
 def kernel_choice(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Making a decision or choice between options.
@@ -140,8 +175,7 @@ def kernel_choice(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Choice(Release) -- choosing to do something
       - Choice(option1, option2) -- choosing between things
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     char = chars[0] if chars else _get_default_actor(ctx, chars)
     
@@ -151,7 +185,8 @@ def kernel_choice(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         if len(non_chars) >= 2:
             # Choosing between multiple options
             options = [_to_phrase(opt) for opt in non_chars]
-            return StoryFragment(f"{char.name} had to choose between {NLGUtils.join_list(options)}.")
+            choice = options[0] + " and " + options[1] if len(options) == 2 else _join(options)
+            return StoryFragment(f"{char.name} had to choose between {choice}.")
         elif non_chars:
             # Choosing to do something specific
             choice = _to_phrase(non_chars[0])
@@ -160,70 +195,42 @@ def kernel_choice(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f"{char.name} made a choice.")
     
     # No character - choice as concept
-    if non_chars:
-        if len(non_chars) >= 2:
-            options = [_to_phrase(opt) for opt in non_chars]
-            return StoryFragment(f"a choice between {NLGUtils.join_list(options)}", kernel_name="Choice")
-        else:
-            choice = _to_phrase(non_chars[0])
-            return StoryFragment(f"the choice was {choice}", kernel_name="Choice")
+    if len(non_chars) >= 2:
+        options = [_to_phrase(opt) for opt in non_chars]
+        choice = options[0] + " and " + options[1] if len(options) == 2 else _join(options)
+        return StoryFragment(f"a choice between {choice}", kernel_name="Choice")
+    elif non_chars:
+        choice = _to_phrase(non_chars[0])
+        return StoryFragment(f"the choice was {choice}", kernel_name="Choice")
     
-    return StoryFragment("a choice", kernel_name="Choice")
+    return _CHOICE_CONCEPT
 
 
-@REGISTRY.kernel("Upset")
 def kernel_upset(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Emotional state of being distressed or upset.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    char, _, _ = _first_char_and_other(args)
     
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
+    if char is None:
+        char = _get_default_actor(ctx, ())
     
     if char:
-        char.Sadness += 10
-        char.Anger += 5
         char.Joy -= 5
+        char.Anger += 5
+        char.Sadness += 10
         return StoryFragment(f"{char.name} was upset.")
     
-    return StoryFragment("there was distress", kernel_name="Upset")
-
-
-@REGISTRY.kernel("State")
-def kernel_state(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    General state description.
-    
-    Pattern: State(Billy, clothes(small))
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    if chars:
-        char = chars[0]
-        if non_chars:
-            state = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} was in a state of {state}.")
-        else:
-            return StoryFragment(f"{char.name} was in a particular state.")
-    
-    # No character - state as concept
-    if non_chars:
-        state = _to_phrase(non_chars[0])
-        return StoryFragment(f"the state was {state}", kernel_name="State")
-    
-    return StoryFragment("a state", kernel_name="State")
+    return _UPSET_CONCEPT
 
 
-@REGISTRY.kernel("Receive")
 def kernel_receive(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Receiving something.
     
     Common pattern: Receive(char, item)
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     char = chars[0] if chars else _get_default_actor(ctx, chars)
     
@@ -241,11 +248,10 @@ def kernel_receive(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         item = _to_phrase(non_chars[0])
         return StoryFragment(f"receiving a {item}", kernel_name="Receive")
     
-    return StoryFragment("receiving something", kernel_name="Receive")
+    return _RECEIVE_CONCEPT
 
 
-@REGISTRY.kernel("Disruption")
-def kernel_disruption(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_disruption(ctx: StoryContext, *args, effect=None, reaction=None, **kwargs) -> StoryFragment:
     """
     Something unexpected disrupts the normal routine.
     
@@ -254,11 +260,7 @@ def kernel_disruption(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Disruption(light, staysOn) -- simple disruption
       - Disruption(Earthquake, effect=Shake, reaction=Fear(Lily))
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    effect = kwargs.get('effect', None)
-    reaction = kwargs.get('reaction', None)
+    chars, non_chars = _split_args(args)
     
     if chars:
         char = chars[0]
@@ -278,11 +280,10 @@ def kernel_disruption(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         else:
             return StoryFragment(f"the disruption was {disruption}", kernel_name="Disruption")
     
-    return StoryFragment("there was a disruption", kernel_name="Disruption")
+    return _DISRUPTION_CONCEPT
 
 
-@REGISTRY.kernel("Task")
-def kernel_task(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_task(ctx: StoryContext, *args, process=None, **kwargs) -> StoryFragment:
     """
     A task or duty to be performed.
     
@@ -291,10 +292,7 @@ def kernel_task(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Task(Anna, process=Lift(furniture) + Return(furniture))
       - Task(Lily, clean(room, toys))
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    process = kwargs.get('process', None)
+    chars, non_chars = _split_args(args)
     
     if chars:
         char = chars[0]
@@ -312,11 +310,10 @@ def kernel_task(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         task = _to_phrase(non_chars[0])
         return StoryFragment(f"the task was {task}", kernel_name="Task")
     
-    return StoryFragment("there was a task", kernel_name="Task")
+    return _TASK_CONCEPT
 
 
-@REGISTRY.kernel("Answer")
-def kernel_answer(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_answer(ctx: StoryContext, *args, object=None, reason=None, explanation=None, **kwargs) -> StoryFragment:
     """
     Responding to a question or inquiry.
     
@@ -325,12 +322,7 @@ def kernel_answer(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Answer(Butterfly, reason=Special) -- answering with reason
       - Answer(Mom, Noise, explanation=truck)
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    obj = kwargs.get('object', None)
-    reason = kwargs.get('reason', None)
-    explanation = kwargs.get('explanation', None)
+    chars, non_chars = _split_args(args)
     
     if chars:
         char = chars[0]
@@ -340,8 +332,8 @@ def kernel_answer(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f"{char.name} explained that it was {_to_phrase(explanation)}.")
         elif reason:
             return StoryFragment(f"{char.name} answered that it was because of {_to_phrase(reason)}.")
-        elif obj:
-            return StoryFragment(f"{char.name} answered about the {_to_phrase(obj)}.")
+        elif object:
+            return StoryFragment(f"{char.name} answered about the {_to_phrase(object)}.")
         elif non_chars:
             topic = _to_phrase(non_chars[0])
             return StoryFragment(f"{char.name} answered about {topic}.")
@@ -349,40 +341,9 @@ def kernel_answer(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f"{char.name} answered the question.")
     
     # No character - answer as concept
-    return StoryFragment("there was an answer", kernel_name="Answer")
-
-
-@REGISTRY.kernel("Remove")
-def kernel_remove(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Taking something off or removing it.
-    
-    Patterns:
-      - Remove(shoes) -- removing clothing/items
-      - Attempt(Remove(necklace)) -- trying to remove
-      - Remove(uniform) -- taking off
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            item = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} removed the {item}.")
-        else:
-            return StoryFragment(f"{char.name} removed it.")
-    
-    # No character - remove as concept
-    if non_chars:
-        item = _to_phrase(non_chars[0])
-        return StoryFragment(f"removing the {item}", kernel_name="Remove")
-    
-    return StoryFragment("removing", kernel_name="Remove")
+    return _ANSWER_CONCEPT
 
 
-@REGISTRY.kernel("Fill")
 def kernel_fill(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Filling something with contents.
@@ -391,8 +352,7 @@ def kernel_fill(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Fill(bag, fruit) -- filling container with items
       - Fill(tub) -- filling with water/contents
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     char = chars[0] if chars else _get_default_actor(ctx, chars)
     
@@ -413,72 +373,9 @@ def kernel_fill(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if char:
         return StoryFragment(f"{char.name} filled it.")
     
-    return StoryFragment("filling", kernel_name="Fill")
-
-
-@REGISTRY.kernel("Response")
-def kernel_response(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Responding or reacting to something.
-    
-    Patterns:
-      - Response(Timmy, smile + affirmation) -- responding with action
-      - Response(Family, Run(inside) + Look(window)) -- reacting to event
-      - Response(Girl, say(potato)) -- verbal response
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 2  # Responding is engaging
-        if non_chars:
-            response = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} responded with {response}.")
-        else:
-            return StoryFragment(f"{char.name} responded.")
-    
-    # No character - response as concept
-    if non_chars:
-        response = _to_phrase(non_chars[0])
-        return StoryFragment(f"the response was {response}", kernel_name="Response")
-    
-    return StoryFragment("there was a response", kernel_name="Response")
-
-
-@REGISTRY.kernel("Claim")
-def kernel_claim(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Claiming ownership or asserting possession.
-    
-    Patterns:
-      - Claim(tree) -- claiming ownership of something
-      - Claim(chair) -- asserting possession
-      - Claim(mountain) + Gift(ownership(mountain))
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 3  # Claiming brings satisfaction
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f'{char.name} claimed the {thing} as their own.')
-        else:
-            return StoryFragment(f"{char.name} made a claim.")
-    
-    # No character - claim as concept
-    if non_chars:
-        thing = _to_phrase(non_chars[0])
-        return StoryFragment(f"claiming the {thing}", kernel_name="Claim")
-    
-    return StoryFragment("a claim", kernel_name="Claim")
+    return _FILL_CONCEPT
 
 
-@REGISTRY.kernel("Join")
 def kernel_join(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Joining together - physically or socially.
@@ -488,8 +385,7 @@ def kernel_join(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Join(Dog, Cat, Bird, with=Bus+Firefly) -- characters joining a group
       - Invitation(Lily, Tom, Join) -- invitation to join
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     with_whom = kwargs.get('with', None)
     
@@ -498,7 +394,8 @@ def kernel_join(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         names = [c.name for c in chars]
         for c in chars:
             c.Joy += 5  # Joining brings happiness
-        return StoryFragment(f"{NLGUtils.join_list(names)} joined together.")
+        joined = names[0] + " and " + names[1] if len(names) == 2 else _join(names)
+        return StoryFragment(f"{joined} joined together.")
     elif chars:
         # Single character joining
         char = chars[0]
@@ -514,12 +411,12 @@ def kernel_join(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     # No character - joining as concept
     if len(non_chars) >= 2:
         things = [_to_phrase(t) for t in non_chars]
-        return StoryFragment(f"joining {NLGUtils.join_list(things)}", kernel_name="Join")
+        joined = things[0] + " and " + things[1] if len(things) == 2 else _join(things)
+        return StoryFragment(f"joining {joined}", kernel_name="Join")
     
-    return StoryFragment("joining together", kernel_name="Join")
+    return _JOIN_CONCEPT
 
 
-@REGISTRY.kernel("Farewell")
 def kernel_farewell(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Saying goodbye or parting ways.
@@ -529,18 +426,17 @@ def kernel_farewell(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Farewell(Lily, Monster) -- bidding farewell
       - Thanks + Farewell -- combined with gratitude
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     if len(chars) >= 2:
         # Two characters saying goodbye
-        chars[0].Sadness += 3  # Bittersweet
-        chars[0].Love += 2
+        chars[0].Love += 2  # Bittersweet
+        chars[0].Sadness += 3
         return StoryFragment(f"{chars[0].name} said goodbye to {chars[1].name}.")
     elif chars:
         char = chars[0]
-        char.Sadness += 3
         char.Love += 2
+        char.Sadness += 3
         if non_chars:
             who = _to_phrase(non_chars[0])
             return StoryFragment(f"{char.name} bid farewell to {who}.")
@@ -548,42 +444,10 @@ def kernel_farewell(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f"{char.name} said goodbye.")
     
     # No character - farewell as concept
-    return StoryFragment("saying goodbye", kernel_name="Farewell")
+    return _FAREWELL_CONCEPT
 
 
-@REGISTRY.kernel("Respect")
-def kernel_respect(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Showing respect for something or someone.
-    
-    Patterns:
-      - Respect(Nature) -- respecting nature
-      - Respect(others) -- respecting others
-      - Respect(library, others) -- respecting a place and people
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Love += 5  # Respect comes from care
-        if non_chars:
-            target = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} showed respect for {target}.")
-        else:
-            return StoryFragment(f"{char.name} was respectful.")
-    
-    # No character - respect as concept/value
-    if non_chars:
-        target = _to_phrase(non_chars[0])
-        return StoryFragment(f"respect for {target}", kernel_name="Respect")
-    
-    return StoryFragment("respect", kernel_name="Respect")
-
-
-@REGISTRY.kernel("Grant")
-def kernel_grant(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_grant(ctx: StoryContext, *args, item=None, condition=None, **kwargs) -> StoryFragment:
     """
     Granting permission or giving something.
     
@@ -592,11 +456,7 @@ def kernel_grant(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Grant(Man, play(guitar), condition=Careful) -- granting with condition
       - Grant(Mommy, item=airplane) -- granting an item
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    item = kwargs.get('item', None)
-    condition = kwargs.get('condition', None)
+    chars, non_chars = _split_args(args)
     
     if chars:
         char = chars[0]
@@ -619,42 +479,9 @@ def kernel_grant(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         thing = _to_phrase(non_chars[0])
         return StoryFragment(f"granting {thing}", kernel_name="Grant")
     
-    return StoryFragment("a grant", kernel_name="Grant")
-
-
-@REGISTRY.kernel("Concern")
-def kernel_concern(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Worry or care about something.
-    
-    Patterns:
-      - Concern(Owner) -- character showing concern
-      - Concern(LowWater) -- concern about a situation
-      - Concern(ball) -- concern about an object
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Sadness += 5
-        char.Love += 3  # Concern comes from caring
-        if non_chars:
-            about = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} was concerned about {about}.")
-        else:
-            return StoryFragment(f"{char.name} was worried.")
-    
-    # No character - concern as concept
-    if non_chars:
-        about = _to_phrase(non_chars[0])
-        return StoryFragment(f"concern about {about}", kernel_name="Concern")
-    
-    return StoryFragment("there was concern", kernel_name="Concern")
+    return _GRANT_CONCEPT
 
 
-@REGISTRY.kernel("Temptation")
 def kernel_temptation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Being tempted by something.
@@ -663,8 +490,7 @@ def kernel_temptation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Temptation(Box, tuna) -- tempted by object
       - Temptation(Cubey, find(toy) + Lie(about=ground))
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     char = chars[0] if chars else _get_default_actor(ctx, chars)
     
@@ -685,40 +511,10 @@ def kernel_temptation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         thing = _to_phrase(non_chars[0])
         return StoryFragment(f"temptation of {thing}", kernel_name="Temptation")
     
-    return StoryFragment("there was temptation", kernel_name="Temptation")
-
-
-@REGISTRY.kernel("Go")
-def kernel_go(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Going somewhere or to do something.
-    
-    Patterns:
-      - Go(outside) -- going to a place
-      - Go(park) -- going somewhere
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            place = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} went to the {place}.")
-        else:
-            return StoryFragment(f"{char.name} went there.")
-    
-    # No character - going as concept
-    if non_chars:
-        place = _to_phrase(non_chars[0])
-        return StoryFragment(f"going to {place}", kernel_name="Go")
-    
-    return StoryFragment("going", kernel_name="Go")
+    return _TEMPTATION_CONCEPT
 
 
-@REGISTRY.kernel("Crisis")
-def kernel_crisis(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_crisis(ctx: StoryContext, *args, cause=None, **kwargs) -> StoryFragment:
     """
     A critical or dangerous situation.
     
@@ -726,10 +522,7 @@ def kernel_crisis(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Crisis(Storm + Rain + Flood(river))
       - Crisis(Town, cause=Threat(Tornado), emotion=Fear)
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    cause = kwargs.get('cause', None)
+    chars, non_chars = _split_args(args)
     
     if chars:
         char = chars[0]
@@ -750,61 +543,10 @@ def kernel_crisis(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         crisis = _to_phrase(non_chars[0])
         return StoryFragment(f"a crisis: {crisis}", kernel_name="Crisis")
     
-    return StoryFragment("there was a crisis", kernel_name="Crisis")
-
-
-@REGISTRY.kernel("Wet")
-def kernel_wet(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Being or getting wet.
-    
-    Patterns:
-      - Wet(Lily) -- character getting wet
-      - rain(state=Wet+Rough)
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} got wet from the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} got wet.")
-    
-    # No character - wet as state
-    if non_chars:
-        thing = _to_phrase(non_chars[0])
-        return StoryFragment(f"wet {thing}", kernel_name="Wet")
-    
-    return StoryFragment("wet", kernel_name="Wet")
-
-
-@REGISTRY.kernel("Dry")
-def kernel_dry(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Being or getting dry.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        return StoryFragment(f"{char.name} dried off.")
-    
-    # No character - dry as state
-    if non_chars:
-        thing = _to_phrase(non_chars[0])
-        return StoryFragment(f"dry {thing}", kernel_name="Dry")
-    
-    return StoryFragment("dry", kernel_name="Dry")
+    return _CRISIS_CONCEPT
 
 
-@REGISTRY.kernel("Command")
-def kernel_command(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_command(ctx: StoryContext, *args, to=None, action=None, **kwargs) -> StoryFragment:
     """
     Giving a command or order.
     
@@ -812,19 +554,14 @@ def kernel_command(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
       - Command(Dad, Quit(Cartoons))
       - Command(BoyMom, to=Boy, action=Return(coat))
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    to = kwargs.get('to', None)
-    action = kwargs.get('action', None)
+    chars, non_chars = _split_args(args)
     
     if chars:
         char = chars[0]
         char.Anger += 2  # Commands can be stern
         
         if to and action:
-            to_name = to.name if isinstance(to, Character) else str(to)
-            return StoryFragment(f"{char.name} commanded {to_name} to {_to_phrase(action)}.")
+            return StoryFragment(f"{char.name} commanded {_name(to)} to {_to_phrase(action)}.")
         elif non_chars:
             command = _to_phrase(non_chars[0])
             return StoryFragment(f"{char.name} gave the command to {command}.")
@@ -836,121 +573,588 @@ def kernel_command(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         command = _to_phrase(non_chars[0])
         return StoryFragment(f"the command was {command}", kernel_name="Command")
     
-    return StoryFragment("a command", kernel_name="Command")
-
-
-@REGISTRY.kernel("Agreement")
-def kernel_agreement(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Agreeing to something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    return _COMMAND_CONCEPT
+
+
+# =============================================================================
+# TABLE-DRIVEN KERNELS
+# =============================================================================
+
+# Kernels whose whole behaviour is "pick the actor, nudge some emotions,
+# describe the first object (or not), else fall back to a concept phrase".
+# Each row holds only what differs; _make_kernel closes over it.
+#
+#   deltas       -- emotion field -> delta, added to the actor
+#   char_obj     -- actor + first object  ("%s" name, "%s" object phrase)
+#   char_only    -- actor, no object      ("%s" name)
+#   concept_obj  -- no actor, object      ("%s" object phrase)
+#   concept      -- no actor, no object
+#   default_actor -- fall back to _get_default_actor when no Character given
+#
+# A None template means the branch is skipped and the next one applies.
+SPECS: Dict[str, Dict[str, Any]] = {
+    "State": {
+        "deltas": None,
+        "char_obj": "%s was in a state of %s.",
+        "char_only": "%s was in a particular state.",
+        "concept_obj": "the state was %s",
+        "concept": "a state",
+        "default_actor": False,
+        "doc": """
+    General state description.
     
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
+    Pattern: State(Billy, clothes(small))
+    """,
+    },
+    "Remove": {
+        "deltas": None,
+        "char_obj": "%s removed the %s.",
+        "char_only": "%s removed it.",
+        "concept_obj": "removing the %s",
+        "concept": "removing",
+        "doc": """
+    Taking something off or removing it.
     
-    if char:
-        char.Joy += 3
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} agreed to {thing}.")
-        else:
-            return StoryFragment(f"{char.name} agreed.")
+    Patterns:
+      - Remove(shoes) -- removing clothing/items
+      - Attempt(Remove(necklace)) -- trying to remove
+      - Remove(uniform) -- taking off
+    """,
+    },
+    "Response": {
+        "deltas": {"Joy": 2},  # Responding is engaging
+        "char_obj": "%s responded with %s.",
+        "char_only": "%s responded.",
+        "concept_obj": "the response was %s",
+        "concept": "there was a response",
+        "doc": """
+    Responding or reacting to something.
     
-    return StoryFragment("there was agreement", kernel_name="Agreement")
-
-
-@REGISTRY.kernel("Feel")
-def kernel_feel(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Feeling something (emotion or physical sensation).
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    Patterns:
+      - Response(Timmy, smile + affirmation) -- responding with action
+      - Response(Family, Run(inside) + Look(window)) -- reacting to event
+      - Response(Girl, say(potato)) -- verbal response
+    """,
+    },
+    "Claim": {
+        "deltas": {"Joy": 3},  # Claiming brings satisfaction
+        "char_obj": "%s claimed the %s as their own.",
+        "char_only": "%s made a claim.",
+        "concept_obj": "claiming the %s",
+        "concept": "a claim",
+        "doc": """
+    Claiming ownership or asserting possession.
     
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
+    Patterns:
+      - Claim(tree) -- claiming ownership of something
+      - Claim(chair) -- asserting possession
+      - Claim(mountain) + Gift(ownership(mountain))
+    """,
+    },
+    "Respect": {
+        "deltas": {"Love": 5},  # Respect comes from care
+        "char_obj": "%s showed respect for %s.",
+        "char_only": "%s was respectful.",
+        "concept_obj": "respect for %s",
+        "concept": "respect",
+        "doc": """
+    Showing respect for something or someone.
     
-    if char:
-        if non_chars:
-            feeling = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} felt {feeling}.")
-        else:
-            return StoryFragment(f"{char.name} felt something.")
+    Patterns:
+      - Respect(Nature) -- respecting nature
+      - Respect(others) -- respecting others
+      - Respect(library, others) -- respecting a place and people
+    """,
+    },
+    "Concern": {
+        "deltas": {"Sadness": 5, "Love": 3},  # Concern comes from caring
+        "char_obj": "%s was concerned about %s.",
+        "char_only": "%s was worried.",
+        "concept_obj": "concern about %s",
+        "concept": "there was concern",
+        "doc": """
+    Worry or care about something.
     
-    return StoryFragment("a feeling", kernel_name="Feel")
-
-
-@REGISTRY.kernel("Turn")
-def kernel_turn(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Turning something or taking a turn.
+    Patterns:
+      - Concern(Owner) -- character showing concern
+      - Concern(LowWater) -- concern about a situation
+      - Concern(ball) -- concern about an object
+    """,
+    },
+    "Go": {
+        "deltas": None,
+        "char_obj": "%s went to the %s.",
+        "char_only": "%s went there.",
+        "concept_obj": "going to %s",
+        "concept": "going",
+        "doc": """
+    Going somewhere or to do something.
     
     Patterns:
-      - Turn(Tim, tap, result=water)
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+      - Go(outside) -- going to a place
+      - Go(park) -- going somewhere
+    """,
+    },
+    "Wet": {
+        "deltas": None,
+        "char_obj": "%s got wet from the %s.",
+        "char_only": "%s got wet.",
+        "concept_obj": "wet %s",
+        "concept": "wet",
+        "doc": """
+    Being or getting wet.
     
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
+    Patterns:
+      - Wet(Lily) -- character getting wet
+      - rain(state=Wet+Rough)
+    """,
+    },
+    "Dry": {
+        "deltas": None,
+        "char_obj": None,
+        "char_only": "%s dried off.",
+        "concept_obj": "dry %s",
+        "concept": "dry",
+        "doc": """
+    Being or getting dry.
+    """,
+    },
+    "Agreement": {
+        "deltas": {"Joy": 3},
+        "char_obj": "%s agreed to %s.",
+        "char_only": "%s agreed.",
+        "concept_obj": None,
+        "concept": "there was agreement",
+        "doc": """
+    Agreeing to something.
+    """,
+    },
+    "Feel": {
+        "deltas": None,
+        "char_obj": "%s felt %s.",
+        "char_only": "%s felt something.",
+        "concept_obj": None,
+        "concept": "a feeling",
+        "doc": """
+    Feeling something (emotion or physical sensation).
+    """,
+    },
+    "Turn": {
+        "deltas": None,
+        "char_obj": "%s turned the %s.",
+        "char_only": "%s took a turn.",
+        "concept_obj": None,
+        "concept": "turning",
+        "doc": """
+    Turning something or taking a turn.
     
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} turned the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} took a turn.")
-    
-    return StoryFragment("turning", kernel_name="Turn")
+    Patterns:
+      - Turn(Tim, tap, result=water)
+    """,
+    },
+    "Win": {
+        "deltas": {"Joy": 20, "Love": 5},  # Pride in victory
+        "char_obj": "%s won the %s!",
+        "char_only": "%s won!",
+        "concept_obj": None,
+        "concept": "victory",
+        "doc": """
+    Winning a competition or achieving victory.
+    """,
+    },
+    "Smell": {
+        "deltas": None,
+        "char_obj": "%s smelled the %s.",
+        "char_only": "%s smelled something.",
+        "concept_obj": "the smell of %s",
+        "concept": "a smell",
+        "doc": """
+    Smelling something.
+    """,
+    },
+    "Bath": {
+        "deltas": {"Joy": 5},
+        "char_obj": None,
+        "char_only": "%s took a bath.",
+        "concept_obj": None,
+        "concept": "taking a bath",
+        "doc": """
+    Taking a bath.
+    """,
+    },
+    "PickUp": {
+        "deltas": None,
+        "char_obj": "%s picked up the %s.",
+        "char_only": "%s picked it up.",
+        "concept_obj": None,
+        "concept": "picking up",
+        "doc": """
+    Picking something up.
+    """,
+    },
+    "Bring": {
+        "deltas": None,
+        "char_obj": "%s brought the %s.",
+        "char_only": "%s brought it.",
+        "concept_obj": None,
+        "concept": "bringing something",
+        "doc": """
+    Bringing something or someone.
+    """,
+    },
+    "Decorate": {
+        "deltas": {"Joy": 8},
+        "char_obj": "%s decorated the %s.",
+        "char_only": "%s decorated it.",
+        "concept_obj": None,
+        "concept": "decorating",
+        "doc": """
+    Decorating something.
+    """,
+    },
+    "Awe": {
+        "deltas": {"Joy": 15},
+        "char_obj": None,
+        "char_only": "%s was filled with awe.",
+        "concept_obj": None,
+        "concept": "awe",
+        "doc": """
+    Feeling awe or wonder.
+    """,
+    },
+    "Fold": {
+        "deltas": None,
+        "char_obj": "%s folded the %s.",
+        "char_only": "%s folded it.",
+        "concept_obj": None,
+        "concept": "folding",
+        "doc": """
+    Folding something.
+    """,
+    },
+    "Sort": {
+        "deltas": None,
+        "char_obj": "%s sorted the %s.",
+        "char_only": "%s sorted things out.",
+        "concept_obj": None,
+        "concept": "sorting",
+        "doc": """
+    Sorting things.
+    """,
+    },
+    "Resolve": {
+        "deltas": {"Joy": 10},
+        "char_obj": "%s resolved the %s.",
+        "char_only": "%s resolved the issue.",
+        "concept_obj": None,
+        "concept": "resolving the problem",
+        "doc": """
+    Resolving a problem or situation.
+    """,
+    },
+    "Experiment": {
+        "deltas": {"Joy": 5},
+        "char_obj": "%s experimented with %s.",
+        "char_only": "%s experimented.",
+        "concept_obj": None,
+        "concept": "an experiment",
+        "doc": """
+    Experimenting or trying something.
+    """,
+    },
+    "Skill": {
+        "deltas": {"Joy": 5},
+        "char_obj": "%s showed skill in %s.",
+        "char_only": "%s was skillful.",
+        "concept_obj": None,
+        "concept": "skill",
+        "doc": """
+    Having or demonstrating a skill.
+    """,
+    },
+    "Belief": {
+        "deltas": {"Joy": 5},
+        "char_obj": "%s believed in %s.",
+        "char_only": "%s had a strong belief.",
+        "concept_obj": None,
+        "concept": "belief",
+        "doc": """
+    Believing something.
+    """,
+    },
+    "Prepare": {
+        "deltas": None,
+        "char_obj": "%s prepared for %s.",
+        "char_only": "%s prepared.",
+        "concept_obj": None,
+        "concept": "preparing",
+        "doc": """
+    Preparing for something.
+    """,
+    },
+    "Deliver": {
+        "deltas": None,
+        "char_obj": "%s delivered the %s.",
+        "char_only": "%s delivered it.",
+        "concept_obj": None,
+        "concept": "delivering",
+        "doc": """
+    Delivering something.
+    """,
+    },
+    "View": {
+        "deltas": None,
+        "char_obj": "%s viewed the %s.",
+        "char_only": "%s took in the view.",
+        "concept_obj": None,
+        "concept": "viewing",
+        "doc": """
+    Viewing or looking at something.
+    """,
+    },
+    "Apply": {
+        "deltas": None,
+        "char_obj": "%s applied %s.",
+        "char_only": "%s applied it.",
+        "concept_obj": None,
+        "concept": "applying",
+        "doc": """
+    Applying something.
+    """,
+    },
+    "Preference": {
+        "deltas": None,
+        "char_obj": "%s preferred %s.",
+        "char_only": "%s had a preference.",
+        "concept_obj": None,
+        "concept": "a preference",
+        "doc": """
+    Having a preference.
+    """,
+    },
+    "Get": {
+        "deltas": {"Joy": 5},
+        "char_obj": "%s got %s.",
+        "char_only": "%s got it.",
+        "concept_obj": None,
+        "concept": "getting something",
+        "doc": """
+    Getting something.
+    """,
+    },
+    "Suggest": {
+        "deltas": None,
+        "char_obj": "%s suggested %s.",
+        "char_only": "%s made a suggestion.",
+        "concept_obj": None,
+        "concept": "a suggestion",
+        "doc": """
+    Suggesting something.
+    """,
+    },
+    "Organize": {
+        "deltas": {"Joy": 5},
+        "char_obj": "%s organized the %s.",
+        "char_only": "%s organized everything.",
+        "concept_obj": None,
+        "concept": "organizing",
+        "doc": """
+    Organizing things.
+    """,
+    },
+    "Fetch": {
+        "deltas": None,
+        "char_obj": "%s fetched the %s.",
+        "char_only": "%s fetched it.",
+        "concept_obj": None,
+        "concept": "fetching",
+        "doc": """
+    Fetching something.
+    """,
+    },
+    "Commitment": {
+        "deltas": {"Love": 5},
+        "char_obj": "%s made a commitment to %s.",
+        "char_only": "%s made a commitment.",
+        "concept_obj": None,
+        "concept": "a commitment",
+        "doc": """
+    Making a commitment.
+    """,
+    },
+    "Sound": {
+        "deltas": None,
+        "char_obj": "%s made a %s sound.",
+        "char_only": "%s made a sound.",
+        "concept_obj": "the sound of %s",
+        "concept": "a sound",
+        "doc": """
+    A sound or making a sound.
+    """,
+    },
+    "Disappointment": {
+        "deltas": {"Sadness": 10, "Joy": -5},
+        "char_obj": None,
+        "char_only": "%s felt disappointed.",
+        "concept_obj": None,
+        "concept": "disappointment",
+        "doc": """
+    Feeling disappointed.
+    """,
+    },
+    "Neglect": {
+        "deltas": {"Sadness": 5, "Anger": 3},
+        "char_obj": "%s neglected the %s.",
+        "char_only": "%s neglected their duty.",
+        "concept_obj": None,
+        "concept": "neglect",
+        "doc": """
+    Neglecting something or someone.
+    """,
+    },
+    "Altruism": {
+        "deltas": {"Love": 15, "Joy": 10},
+        "char_obj": None,
+        "char_only": "%s showed selfless kindness.",
+        "concept_obj": None,
+        "concept": "an act of kindness",
+        "doc": """
+    Showing altruism or selflessness.
+    """,
+    },
+    "Balance": {
+        "deltas": None,
+        "char_obj": "%s balanced the %s.",
+        "char_only": "%s found balance.",
+        "concept_obj": None,
+        "concept": "balance",
+        "doc": """
+    Balancing something or achieving balance.
+    """,
+    },
+    "ReturnHome": {
+        "deltas": {"Joy": 8},
+        "char_obj": None,
+        "char_only": "%s returned home.",
+        "concept_obj": None,
+        "concept": "returning home",
+        "doc": """
+    Returning home.
+    """,
+    },
+    "Disobedience": {
+        "deltas": {"Anger": 5},
+        "char_obj": None,
+        "char_only": "%s was disobedient.",
+        "concept_obj": None,
+        "concept": "disobedience",
+        "doc": """
+    Being disobedient.
+    """,
+    },
+}
+
+
+def _make_kernel(name: str, spec: Dict[str, Any]) -> Callable[..., StoryFragment]:
+    """Build the kernel function described by one SPECS row."""
+    deltas = tuple((spec["deltas"] or {}).items())
+    char_obj = spec["char_obj"]
+    char_only = spec["char_only"]
+    concept_obj = spec["concept_obj"]
+    default_actor = spec.get("default_actor", True)
+    concept = StoryFragment(spec["concept"], kernel_name=name)
+    
+    def kernel(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+        char, has_other, other = _first_char_and_other(args)
+        
+        if char is None and default_actor:
+            char = _get_default_actor(ctx, ())
+        
+        if char:
+            for emotion, delta in deltas:
+                setattr(char, emotion, getattr(char, emotion) + delta)
+            if has_other and char_obj:
+                return StoryFragment(char_obj % (char.name, _to_phrase(other)))
+            return StoryFragment(char_only % char.name)
+        
+        # No character - used as concept
+        if has_other and concept_obj:
+            return StoryFragment(concept_obj % _to_phrase(other), kernel_name=name)
+        
+        return concept
+    
+    kernel.__name__ = kernel.__qualname__ = f"kernel_{name.lower()}"
+    kernel.__doc__ = spec["doc"]
+    return kernel
+
+
+kernel_state = _make_kernel("State", SPECS["State"])
+kernel_remove = _make_kernel("Remove", SPECS["Remove"])
+kernel_response = _make_kernel("Response", SPECS["Response"])
+kernel_claim = _make_kernel("Claim", SPECS["Claim"])
+kernel_respect = _make_kernel("Respect", SPECS["Respect"])
+kernel_concern = _make_kernel("Concern", SPECS["Concern"])
+kernel_go = _make_kernel("Go", SPECS["Go"])
+kernel_wet = _make_kernel("Wet", SPECS["Wet"])
+kernel_dry = _make_kernel("Dry", SPECS["Dry"])
+kernel_agreement = _make_kernel("Agreement", SPECS["Agreement"])
+kernel_feel = _make_kernel("Feel", SPECS["Feel"])
+kernel_turn = _make_kernel("Turn", SPECS["Turn"])
+kernel_win = _make_kernel("Win", SPECS["Win"])
+kernel_smell = _make_kernel("Smell", SPECS["Smell"])
+kernel_bath = _make_kernel("Bath", SPECS["Bath"])
+kernel_pickup = _make_kernel("PickUp", SPECS["PickUp"])
+kernel_bring = _make_kernel("Bring", SPECS["Bring"])
+kernel_decorate = _make_kernel("Decorate", SPECS["Decorate"])
+kernel_awe = _make_kernel("Awe", SPECS["Awe"])
+kernel_fold = _make_kernel("Fold", SPECS["Fold"])
+kernel_sort = _make_kernel("Sort", SPECS["Sort"])
+kernel_resolve = _make_kernel("Resolve", SPECS["Resolve"])
+kernel_experiment = _make_kernel("Experiment", SPECS["Experiment"])
+kernel_skill = _make_kernel("Skill", SPECS["Skill"])
+kernel_belief = _make_kernel("Belief", SPECS["Belief"])
+kernel_prepare = _make_kernel("Prepare", SPECS["Prepare"])
+kernel_deliver = _make_kernel("Deliver", SPECS["Deliver"])
+kernel_view = _make_kernel("View", SPECS["View"])
+kernel_apply = _make_kernel("Apply", SPECS["Apply"])
+kernel_preference = _make_kernel("Preference", SPECS["Preference"])
+kernel_get = _make_kernel("Get", SPECS["Get"])
+kernel_suggest = _make_kernel("Suggest", SPECS["Suggest"])
+kernel_organize = _make_kernel("Organize", SPECS["Organize"])
+kernel_fetch = _make_kernel("Fetch", SPECS["Fetch"])
+kernel_commitment = _make_kernel("Commitment", SPECS["Commitment"])
+kernel_sound = _make_kernel("Sound", SPECS["Sound"])
+kernel_disappointment = _make_kernel("Disappointment", SPECS["Disappointment"])
+kernel_neglect = _make_kernel("Neglect", SPECS["Neglect"])
+kernel_altruism = _make_kernel("Altruism", SPECS["Altruism"])
+kernel_balance = _make_kernel("Balance", SPECS["Balance"])
+kernel_returnhome = _make_kernel("ReturnHome", SPECS["ReturnHome"])
+kernel_disobedience = _make_kernel("Disobedience", SPECS["Disobedience"])
 
 
-@REGISTRY.kernel("Cheer")
 def kernel_cheer(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Cheering or showing enthusiasm.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     if chars:
         for c in chars:
             c.Joy += 10
         if len(chars) > 1:
-            names = NLGUtils.join_list([c.name for c in chars])
+            names = _join_names([c.name for c in chars])
             return StoryFragment(f"{names} cheered with excitement!")
         else:
             return StoryFragment(f"{chars[0].name} cheered!")
     
-    return StoryFragment("there was cheering", kernel_name="Cheer")
-
-
-@REGISTRY.kernel("Win")
-def kernel_win(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Winning a competition or achieving victory.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 20
-        char.Love += 5  # Pride in victory
-        if non_chars:
-            contest = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} won the {contest}!")
-        else:
-            return StoryFragment(f"{char.name} won!")
-    
-    return StoryFragment("victory", kernel_name="Win")
+    return _CHEER_CONCEPT
 
 
-@REGISTRY.kernel("Save")
 def kernel_save(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Saving something or someone.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     char = chars[0] if chars else _get_default_actor(ctx, chars)
     
@@ -966,188 +1170,61 @@ def kernel_save(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         else:
             return StoryFragment(f"{char.name} saved the day!")
     
-    return StoryFragment("a rescue", kernel_name="Save")
+    return _SAVE_CONCEPT
 
 
-@REGISTRY.kernel("Smell")
-def kernel_smell(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Smelling something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} smelled the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} smelled something.")
-    
-    # No character - smell as description
-    if non_chars:
-        thing = _to_phrase(non_chars[0])
-        return StoryFragment(f"the smell of {thing}", kernel_name="Smell")
-    
-    return StoryFragment("a smell", kernel_name="Smell")
-
-
-@REGISTRY.kernel("Bath")
-def kernel_bath(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Taking a bath.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 5
-        return StoryFragment(f"{char.name} took a bath.")
-    
-    return StoryFragment("taking a bath", kernel_name="Bath")
-
-
-@REGISTRY.kernel("PickUp")
-def kernel_pickup(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Picking something up.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} picked up the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} picked it up.")
-    
-    return StoryFragment("picking up", kernel_name="PickUp")
-
-
-@REGISTRY.kernel("Bring")
-def kernel_bring(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Bringing something or someone.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} brought the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} brought it.")
-    
-    return StoryFragment("bringing something", kernel_name="Bring")
-
-
-@REGISTRY.kernel("Kiss")
 def kernel_kiss(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Kissing someone.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    char, other = _two_chars(args)
     
-    if len(chars) >= 2:
-        chars[0].Love += 10
-        chars[0].Joy += 5
-        return StoryFragment(f"{chars[0].name} kissed {chars[1].name}.")
-    elif chars:
-        char = chars[0]
-        char.Love += 10
+    if char:
         char.Joy += 5
+        char.Love += 10
+        if other:
+            return StoryFragment(f"{char.name} kissed {other.name}.")
         return StoryFragment(f"{char.name} gave a kiss.")
     
-    return StoryFragment("a kiss", kernel_name="Kiss")
+    return _KISS_CONCEPT
 
 
-@REGISTRY.kernel("Meeting")
 def kernel_meeting(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Having a meeting or gathering.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     if len(chars) >= 2:
-        names = NLGUtils.join_list([c.name for c in chars])
+        names = _join_names([c.name for c in chars])
         return StoryFragment(f"{names} had a meeting.")
     elif chars:
         return StoryFragment(f"{chars[0].name} attended a meeting.")
     
-    return StoryFragment("there was a meeting", kernel_name="Meeting")
+    return _MEETING_CONCEPT
 
 
-@REGISTRY.kernel("Encouragement")
 def kernel_encouragement(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Encouraging someone.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    char, other = _two_chars(args)
     
-    if len(chars) >= 2:
-        chars[1].Joy += 8
-        return StoryFragment(f"{chars[0].name} encouraged {chars[1].name}.")
-    elif chars:
-        char = chars[0]
+    if other:
+        other.Joy += 8
+        return StoryFragment(f"{char.name} encouraged {other.name}.")
+    elif char:
         char.Joy += 8
         return StoryFragment(f"{char.name} felt encouraged.")
     
-    return StoryFragment("encouragement", kernel_name="Encouragement")
+    return _ENCOURAGEMENT_CONCEPT
 
 
-@REGISTRY.kernel("Decorate")
-def kernel_decorate(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Decorating something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 8
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} decorated the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} decorated it.")
-    
-    return StoryFragment("decorating", kernel_name="Decorate")
-
-
-@REGISTRY.kernel("Awe")
-def kernel_awe(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Feeling awe or wonder.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 15
-        return StoryFragment(f"{char.name} was filled with awe.")
-    
-    return StoryFragment("awe", kernel_name="Awe")
-
-
-@REGISTRY.kernel("Separation")
 def kernel_separation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Being separated from someone or something.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     if len(chars) >= 2:
         chars[0].Sadness += 10
@@ -1161,239 +1238,48 @@ def kernel_separation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         else:
             return StoryFragment(f"{char.name} was separated.")
     
-    return StoryFragment("separation", kernel_name="Separation")
+    return _SEPARATION_CONCEPT
 
 
-@REGISTRY.kernel("Fold")
-def kernel_fold(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Folding something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} folded the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} folded it.")
-    
-    return StoryFragment("folding", kernel_name="Fold")
-
-
-@REGISTRY.kernel("Sort")
-def kernel_sort(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Sorting things.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            things = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} sorted the {things}.")
-        else:
-            return StoryFragment(f"{char.name} sorted things out.")
-    
-    return StoryFragment("sorting", kernel_name="Sort")
-
-
-@REGISTRY.kernel("Resolve")
-def kernel_resolve(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Resolving a problem or situation.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 10
-        if non_chars:
-            problem = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} resolved the {problem}.")
-        else:
-            return StoryFragment(f"{char.name} resolved the issue.")
-    
-    return StoryFragment("resolving the problem", kernel_name="Resolve")
-
-
-@REGISTRY.kernel("Confrontation")
 def kernel_confrontation(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Confronting someone or something.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    char, other = _two_chars(args)
     
-    if len(chars) >= 2:
-        chars[0].Anger += 8
-        chars[0].Fear += 3
-        return StoryFragment(f"{chars[0].name} confronted {chars[1].name}.")
-    elif chars:
-        char = chars[0]
-        char.Anger += 8
+    if char:
         char.Fear += 3
+        char.Anger += 8
+        if other:
+            return StoryFragment(f"{char.name} confronted {other.name}.")
         return StoryFragment(f"{char.name} confronted the situation.")
     
-    return StoryFragment("a confrontation", kernel_name="Confrontation")
-
-
-@REGISTRY.kernel("Experiment")
-def kernel_experiment(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Experimenting or trying something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 5
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} experimented with {thing}.")
-        else:
-            return StoryFragment(f"{char.name} experimented.")
-    
-    return StoryFragment("an experiment", kernel_name="Experiment")
-
-
-@REGISTRY.kernel("Skill")
-def kernel_skill(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Having or demonstrating a skill.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 5
-        if non_chars:
-            skill = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} showed skill in {skill}.")
-        else:
-            return StoryFragment(f"{char.name} was skillful.")
-    
-    return StoryFragment("skill", kernel_name="Skill")
+    return _CONFRONTATION_CONCEPT
 
 
-@REGISTRY.kernel("HideSeek")
 def kernel_hideseek(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Playing hide and seek.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     if chars:
         for c in chars:
             c.Joy += 10
         if len(chars) > 1:
-            names = NLGUtils.join_list([c.name for c in chars])
+            names = _join_names([c.name for c in chars])
             return StoryFragment(f"{names} played hide and seek.")
         else:
             return StoryFragment(f"{chars[0].name} played hide and seek.")
     
-    return StoryFragment("playing hide and seek", kernel_name="HideSeek")
-
-
-@REGISTRY.kernel("Belief")
-def kernel_belief(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Believing something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 5
-        if non_chars:
-            belief = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} believed in {belief}.")
-        else:
-            return StoryFragment(f"{char.name} had a strong belief.")
-    
-    return StoryFragment("belief", kernel_name="Belief")
+    return _HIDESEEK_CONCEPT
 
 
-@REGISTRY.kernel("Prepare")
-def kernel_prepare(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Preparing for something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} prepared for {thing}.")
-        else:
-            return StoryFragment(f"{char.name} prepared.")
-    
-    return StoryFragment("preparing", kernel_name="Prepare")
-
-
-@REGISTRY.kernel("Deliver")
-def kernel_deliver(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Delivering something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} delivered the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} delivered it.")
-    
-    return StoryFragment("delivering", kernel_name="Deliver")
-
-
-@REGISTRY.kernel("View")
-def kernel_view(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Viewing or looking at something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} viewed the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} took in the view.")
-    
-    return StoryFragment("viewing", kernel_name="View")
-
-
-@REGISTRY.kernel("Transport")
 def kernel_transport(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Transporting something or someone.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     char = chars[0] if chars else _get_default_actor(ctx, chars)
     
@@ -1406,191 +1292,76 @@ def kernel_transport(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         else:
             return StoryFragment(f"{char.name} transported it.")
     
-    return StoryFragment("transporting", kernel_name="Transport")
+    return _TRANSPORT_CONCEPT
 
 
-@REGISTRY.kernel("Trick")
 def kernel_trick(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Playing a trick or being tricked.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    char, other = _two_chars(args)
     
-    if len(chars) >= 2:
-        chars[0].Joy += 5
-        chars[1].Surprise += 5
-        return StoryFragment(f"{chars[0].name} played a trick on {chars[1].name}.")
-    elif chars:
-        char = chars[0]
+    if char:
         char.Joy += 5
+        if other:
+            other.Surprise += 5
+            return StoryFragment(f"{char.name} played a trick on {other.name}.")
         return StoryFragment(f"{char.name} played a trick.")
     
-    return StoryFragment("a trick", kernel_name="Trick")
+    return _TRICK_CONCEPT
 
 
-@REGISTRY.kernel("Ongoing")
 def kernel_ongoing(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Something continuing or ongoing.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    if non_chars:
-        thing = _to_phrase(non_chars[0])
-        return StoryFragment(f"{thing} continued", kernel_name="Ongoing")
-    
-    return StoryFragment("it continued", kernel_name="Ongoing")
-
-
-@REGISTRY.kernel("Apply")
-def kernel_apply(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Applying something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} applied {thing}.")
-        else:
-            return StoryFragment(f"{char.name} applied it.")
+    # Characters are ignored; only the first other argument is described
+    for a in args:
+        if type(a) is not Character:
+            return StoryFragment(f"{_to_phrase(a)} continued", kernel_name="Ongoing")
     
-    return StoryFragment("applying", kernel_name="Apply")
+    return _ONGOING_CONCEPT
 
 
-@REGISTRY.kernel("Preference")
-def kernel_preference(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Having a preference.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} preferred {thing}.")
-        else:
-            return StoryFragment(f"{char.name} had a preference.")
-    
-    return StoryFragment("a preference", kernel_name="Preference")
-
-
-@REGISTRY.kernel("Interaction")
 def kernel_interaction(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Interacting with someone or something.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     if len(chars) >= 2:
         for c in chars:
             c.Joy += 3
-        names = NLGUtils.join_list([c.name for c in chars])
+        names = _join_names([c.name for c in chars])
         return StoryFragment(f"{names} interacted.")
     elif chars:
         char = chars[0]
         char.Joy += 3
         return StoryFragment(f"{char.name} interacted.")
     
-    return StoryFragment("an interaction", kernel_name="Interaction")
-
-
-@REGISTRY.kernel("Get")
-def kernel_get(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Getting something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 5
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} got {thing}.")
-        else:
-            return StoryFragment(f"{char.name} got it.")
-    
-    return StoryFragment("getting something", kernel_name="Get")
-
-
-@REGISTRY.kernel("Suggest")
-def kernel_suggest(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Suggesting something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            suggestion = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} suggested {suggestion}.")
-        else:
-            return StoryFragment(f"{char.name} made a suggestion.")
-    
-    return StoryFragment("a suggestion", kernel_name="Suggest")
+    return _INTERACTION_CONCEPT
 
 
-@REGISTRY.kernel("Suggestion")
 def kernel_suggestion(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     A suggestion (noun form).
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    if non_chars:
-        suggestion = _to_phrase(non_chars[0])
-        return StoryFragment(f"the suggestion was {suggestion}", kernel_name="Suggestion")
-    
-    return StoryFragment("a suggestion", kernel_name="Suggestion")
-
-
-@REGISTRY.kernel("Organize")
-def kernel_organize(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Organizing things.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 5
-        if non_chars:
-            things = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} organized the {things}.")
-        else:
-            return StoryFragment(f"{char.name} organized everything.")
+    for a in args:
+        if type(a) is not Character:
+            return StoryFragment(f"the suggestion was {_to_phrase(a)}", kernel_name="Suggestion")
     
-    return StoryFragment("organizing", kernel_name="Organize")
+    return _SUGGESTION_CONCEPT
 
 
-@REGISTRY.kernel("Miss")
 def kernel_miss(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Missing someone or something.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     if len(chars) >= 2:
-        chars[0].Sadness += 8
         chars[0].Love += 5
+        chars[0].Sadness += 8
         return StoryFragment(f"{chars[0].name} missed {chars[1].name}.")
     elif chars:
         char = chars[0]
@@ -1601,142 +1372,34 @@ def kernel_miss(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         else:
             return StoryFragment(f"{char.name} missed them.")
     
-    return StoryFragment("missing someone", kernel_name="Miss")
+    return _MISS_CONCEPT
 
 
-@REGISTRY.kernel("Fetch")
-def kernel_fetch(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Fetching something.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} fetched the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} fetched it.")
-    
-    return StoryFragment("fetching", kernel_name="Fetch")
-
-
-@REGISTRY.kernel("Commitment")
-def kernel_commitment(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Making a commitment.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Love += 5
-        if non_chars:
-            commitment = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} made a commitment to {commitment}.")
-        else:
-            return StoryFragment(f"{char.name} made a commitment.")
-    
-    return StoryFragment("a commitment", kernel_name="Commitment")
-
-
-@REGISTRY.kernel("Fight")
 def kernel_fight(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Fighting.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     if len(chars) >= 2:
         for c in chars:
-            c.Anger += 15
             c.Fear += 5
+            c.Anger += 15
         return StoryFragment(f"{chars[0].name} and {chars[1].name} fought.")
     elif chars:
         char = chars[0]
-        char.Anger += 15
         char.Fear += 5
+        char.Anger += 15
         return StoryFragment(f"{char.name} fought.")
     
-    return StoryFragment("a fight", kernel_name="Fight")
-
-
-@REGISTRY.kernel("Sound")
-def kernel_sound(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    A sound or making a sound.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            sound = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} made a {sound} sound.")
-        else:
-            return StoryFragment(f"{char.name} made a sound.")
-    
-    # No character - sound as concept
-    if non_chars:
-        sound = _to_phrase(non_chars[0])
-        return StoryFragment(f"the sound of {sound}", kernel_name="Sound")
-    
-    return StoryFragment("a sound", kernel_name="Sound")
-
-
-@REGISTRY.kernel("Disappointment")
-def kernel_disappointment(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Feeling disappointed.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Sadness += 10
-        char.Joy -= 5
-        return StoryFragment(f"{char.name} felt disappointed.")
-    
-    return StoryFragment("disappointment", kernel_name="Disappointment")
-
-
-@REGISTRY.kernel("Neglect")
-def kernel_neglect(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Neglecting something or someone.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Sadness += 5
-        char.Anger += 3
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} neglected the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} neglected their duty.")
-    
-    return StoryFragment("neglect", kernel_name="Neglect")
+    return _FIGHT_CONCEPT
 
 
-@REGISTRY.kernel("Reminder")
 def kernel_reminder(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Reminding someone of something.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
+    chars, non_chars = _split_args(args)
     
     if len(chars) >= 2:
         return StoryFragment(f"{chars[0].name} reminded {chars[1].name}.")
@@ -1748,76 +1411,99 @@ def kernel_reminder(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         else:
             return StoryFragment(f"{char.name} remembered.")
     
-    return StoryFragment("a reminder", kernel_name="Reminder")
-
-
-@REGISTRY.kernel("Altruism")
-def kernel_altruism(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Showing altruism or selflessness.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Love += 15
-        char.Joy += 10
-        return StoryFragment(f"{char.name} showed selfless kindness.")
-    
-    return StoryFragment("an act of kindness", kernel_name="Altruism")
-
-
-@REGISTRY.kernel("Balance")
-def kernel_balance(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Balancing something or achieving balance.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    non_chars = [a for a in args if not isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        if non_chars:
-            thing = _to_phrase(non_chars[0])
-            return StoryFragment(f"{char.name} balanced the {thing}.")
-        else:
-            return StoryFragment(f"{char.name} found balance.")
-    
-    return StoryFragment("balance", kernel_name="Balance")
-
-
-@REGISTRY.kernel("ReturnHome")
-def kernel_returnhome(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Returning home.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Joy += 8
-        return StoryFragment(f"{char.name} returned home.")
-    
-    return StoryFragment("returning home", kernel_name="ReturnHome")
-
-
-@REGISTRY.kernel("Disobedience")
-def kernel_disobedience(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
-    """
-    Being disobedient.
-    """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    char = chars[0] if chars else _get_default_actor(ctx, chars)
-    
-    if char:
-        char.Anger += 5
-        return StoryFragment(f"{char.name} was disobedient.")
-    
-    return StoryFragment("disobedience", kernel_name="Disobedience")
+    return _REMINDER_CONCEPT
+
+
+# =============================================================================
+# REGISTRATION
+# =============================================================================
+
+# Kernels listed here are registered in one pass instead of one decorator
+# call each; see KernelRegistry.register_table.
+#
+# Every kernel keeps the uniform (ctx, *args, **kwargs) signature, including
+# the ones that never read ctx (Goal, Inquiry, Task, ...): the executor,
+# bare-name lookups and other packs all call kernels that way, and a per-call
+# "does it want ctx?" check would cost more than the argument it saves.
+# The same goes for **kwargs on kernels that ignore keywords: parsed stories
+# attach keywords to almost any call (Turn(Tim, tap, result=water)), and a
+# kernel without **kwargs would raise TypeError instead of ignoring them.
+_KERNELS: List[Tuple[str, Callable[..., StoryFragment]]] = [
+    ("Goal", kernel_goal),
+    ("Inquiry", kernel_inquiry),
+    ("Choice", kernel_choice),
+    ("Upset", kernel_upset),
+    ("State", kernel_state),
+    ("Receive", kernel_receive),
+    ("Disruption", kernel_disruption),
+    ("Task", kernel_task),
+    ("Answer", kernel_answer),
+    ("Remove", kernel_remove),
+    ("Fill", kernel_fill),
+    ("Response", kernel_response),
+    ("Claim", kernel_claim),
+    ("Join", kernel_join),
+    ("Farewell", kernel_farewell),
+    ("Respect", kernel_respect),
+    ("Grant", kernel_grant),
+    ("Concern", kernel_concern),
+    ("Temptation", kernel_temptation),
+    ("Go", kernel_go),
+    ("Crisis", kernel_crisis),
+    ("Wet", kernel_wet),
+    ("Dry", kernel_dry),
+    ("Command", kernel_command),
+    ("Agreement", kernel_agreement),
+    ("Feel", kernel_feel),
+    ("Turn", kernel_turn),
+    ("Win", kernel_win),
+    ("Smell", kernel_smell),
+    ("Bath", kernel_bath),
+    ("PickUp", kernel_pickup),
+    ("Bring", kernel_bring),
+    ("Decorate", kernel_decorate),
+    ("Awe", kernel_awe),
+    ("Fold", kernel_fold),
+    ("Sort", kernel_sort),
+    ("Resolve", kernel_resolve),
+    ("Experiment", kernel_experiment),
+    ("Skill", kernel_skill),
+    ("Belief", kernel_belief),
+    ("Prepare", kernel_prepare),
+    ("Deliver", kernel_deliver),
+    ("View", kernel_view),
+    ("Apply", kernel_apply),
+    ("Preference", kernel_preference),
+    ("Get", kernel_get),
+    ("Suggest", kernel_suggest),
+    ("Organize", kernel_organize),
+    ("Fetch", kernel_fetch),
+    ("Commitment", kernel_commitment),
+    ("Sound", kernel_sound),
+    ("Disappointment", kernel_disappointment),
+    ("Neglect", kernel_neglect),
+    ("Altruism", kernel_altruism),
+    ("Balance", kernel_balance),
+    ("ReturnHome", kernel_returnhome),
+    ("Disobedience", kernel_disobedience),
+    ("Cheer", kernel_cheer),
+    ("Save", kernel_save),
+    ("Kiss", kernel_kiss),
+    ("Meeting", kernel_meeting),
+    ("Encouragement", kernel_encouragement),
+    ("Separation", kernel_separation),
+    ("Confrontation", kernel_confrontation),
+    ("HideSeek", kernel_hideseek),
+    ("Transport", kernel_transport),
+    ("Trick", kernel_trick),
+    ("Ongoing", kernel_ongoing),
+    ("Interaction", kernel_interaction),
+    ("Suggestion", kernel_suggestion),
+    ("Miss", kernel_miss),
+    ("Fight", kernel_fight),
+    ("Reminder", kernel_reminder),
+]
+REGISTRY.register_table(_KERNELS)
 
 
 # Test the kernels
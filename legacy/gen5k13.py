@@ -20,6 +20,8 @@ KERNELS IMPLEMENTED:
 All kernels follow the standard pattern with appropriate emotional state updates.
 """
 
+from typing import Callable, List, Tuple
+
 from gen5 import (
     REGISTRY,
     StoryContext,
@@ -29,14 +31,31 @@ from gen5 import (
     _to_phrase,
     _event_to_phrase,
     _get_default_actor,
+    _chars_only,
 )
 
 
+# Constant fallback returns, built once and shared between calls
+_SORRY_CONCEPT = StoryFragment("sorry", kernel_name="Sorry")
+_HEAD_HANG_CONCEPT = StoryFragment("head hang", kernel_name="HeadHang")
+_COMFORTED_CONCEPT = StoryFragment("comforted", kernel_name="Comforted")
+_FAMILY_SUPPORT_CONCEPT = StoryFragment("family support", kernel_name="FamilySupport")
+_RESTLESS_CONCEPT = StoryFragment("restless", kernel_name="Restless")
+_BELONGING_CONCEPT = StoryFragment("belonging", kernel_name="Belonging")
+_STAY_FOREVER_CONCEPT = StoryFragment("stay forever", kernel_name="StayForever")
+# Basket's only outputs, by size: (fragment, ctx.current_object)
+_BASKETS = {
+    None: (StoryFragment("a basket", kernel_name="Basket"), "basket"),
+    'tight': (StoryFragment("a tight basket", kernel_name="Basket"), "tight basket"),
+    'big': (StoryFragment("a big basket", kernel_name="Basket"), "big basket"),
+}
+_TOYS = StoryFragment("toys", kernel_name="Toys")
+
+
 # =============================================================================
 # EMOTIONAL EXPRESSIONS & GESTURES
 # =============================================================================
 
-@REGISTRY.kernel("Sorry")
 def kernel_sorry(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Character apologizes or says sorry.
@@ -48,7 +67,7 @@ def kernel_sorry(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Often follows mistakes or accidents in cautionary tales.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     to = kwargs.get('to', None)
     
     if chars:
@@ -56,17 +75,16 @@ def kernel_sorry(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         char.Sadness += 3
         char.Fear += 2
         
-        if isinstance(to, Character):
+        if type(to) is Character:
             return StoryFragment(f'{char.name} said "I\'m sorry" to {to.name}.')
         elif to:
             return StoryFragment(f'{char.name} said "I\'m sorry" to {to}.')
         else:
             return StoryFragment(f'{char.name} mumbled "Sorry," with sad eyes.')
     
-    return StoryFragment("sorry", kernel_name="Sorry")
+    return _SORRY_CONCEPT
 
 
-@REGISTRY.kernel("HeadHang")
 def kernel_headhang(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Head hanging down in shame or guilt - physical gesture.
@@ -77,7 +95,7 @@ def kernel_headhang(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Represents shame, guilt, or physical hanging posture.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     if chars:
         char = chars[0]
@@ -85,10 +103,9 @@ def kernel_headhang(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         return StoryFragment(f"{char.name}'s head hung low in shame.")
     
     # As a state descriptor
-    return StoryFragment("head hang", kernel_name="HeadHang")
+    return _HEAD_HANG_CONCEPT
 
 
-@REGISTRY.kernel("Comforted")
 def kernel_comforted(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Character is comforted and feels better.
@@ -100,7 +117,7 @@ def kernel_comforted(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Result of receiving support, comfort, or care from others.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     by = kwargs.get('by', None)
     
     if chars:
@@ -109,21 +126,20 @@ def kernel_comforted(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         char.Sadness -= 5
         char.Fear -= 5
         
-        if isinstance(by, Character):
+        if type(by) is Character:
             return StoryFragment(f'{char.name} felt comforted by {by.name}.')
         elif by:
             return StoryFragment(f'{char.name} felt comforted by {by}.')
         else:
             return StoryFragment(f'{char.name} felt comforted and safe.')
     
-    return StoryFragment("comforted", kernel_name="Comforted")
+    return _COMFORTED_CONCEPT
 
 
 # =============================================================================
 # FAMILY & SOCIAL PATTERNS
 # =============================================================================
 
-@REGISTRY.kernel("FamilySupport")
 def kernel_family_support(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Family members providing support to each other.
@@ -135,15 +151,19 @@ def kernel_family_support(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Complex pattern representing family dynamics and mutual support.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     # Extract keyword arguments
-    agents = kwargs.get('agents', [])
-    action = kwargs.get('action', None)
-    effect = kwargs.get('effect', None)
-    state = kwargs.get('state', None)
-    process = kwargs.get('process', None)
-    outcome = kwargs.get('outcome', None)
+    if kwargs:
+        get = kwargs.get
+        agents = get('agents', [])
+        action = get('action')
+        effect = get('effect')
+        state = get('state')
+        process = get('process')
+        outcome = get('outcome')
+    else:
+        agents = action = effect = state = process = outcome = None
     
     parts = []
     
@@ -165,7 +185,7 @@ def kernel_family_support(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if agents:
         agent_names = []
         for agent in agents:
-            if isinstance(agent, Character):
+            if type(agent) is Character:
                 agent.Love += 5
                 agent_names.append(agent.name)
             else:
@@ -175,17 +195,12 @@ def kernel_family_support(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             agents_str = NLGUtils.join_list(agent_names)
             parts.append(f"{agents_str} came to support {char.name}.")
     
-    # Action taken
-    if action:
-        action_text = _event_to_phrase(action)
-        if action_text:
-            parts.append(f"{action_text}.")
-    
-    # Process/what happened
-    if process:
-        process_text = _event_to_phrase(process)
-        if process_text:
-            parts.append(f"Together, they {process_text}.")
+    # Action taken, then process/what happened
+    for event, template in ((action, "%s."), (process, "Together, they %s.")):
+        if event:
+            event_text = _event_to_phrase(event)
+            if event_text:
+                parts.append(template % event_text)
     
     # Effect/result
     if effect:
@@ -206,20 +221,21 @@ def kernel_family_support(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             parts.append(f"{outcome_text}.")
     
     if parts:
-        return StoryFragment(' '.join(parts), kernel_name="FamilySupport")
+        # Most calls narrate a single sentence; only join when there are more
+        text = parts[0] if len(parts) == 1 else ' '.join(parts)
+        return StoryFragment(text, kernel_name="FamilySupport")
     
     # Fallback for simple usage
     if char:
         return StoryFragment(f"{char.name} received support from family.")
     
-    return StoryFragment("family support", kernel_name="FamilySupport")
+    return _FAMILY_SUPPORT_CONCEPT
 
 
 # =============================================================================
 # CHARACTER STATES & TRAITS
 # =============================================================================
 
-@REGISTRY.kernel("Restless")
 def kernel_restless(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Character is restless, unable to stay still.
@@ -231,7 +247,7 @@ def kernel_restless(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Character trait indicating inability to settle down.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     char = chars[0] if chars else ctx.current_focus
     
@@ -240,10 +256,12 @@ def kernel_restless(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         return StoryFragment(f"{char.name} was very restless.")
     
     # As a state descriptor, return just the adjective
-    return StoryFragment("restless", kernel_name="Restless")
+    return _RESTLESS_CONCEPT
+
+
+_BELONGING_EVENTS = ('catalyst', 'process', 'outcome')
 
 
-@REGISTRY.kernel("Belonging")
 def kernel_belonging(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Sense of belonging and finding one's place.
@@ -255,61 +273,55 @@ def kernel_belonging(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: About finding community, home, or where one fits in.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
-    
-    catalyst = kwargs.get('catalyst', None)
-    process = kwargs.get('process', None)
-    outcome = kwargs.get('outcome', None)
+    chars = _chars_only(args)
     
     parts = []
     
     # Determine the subject - could be explicitly passed or from context
-    # If an object/group is passed as arg (like "Kids"), that's WHERE they belong, not WHO
-    char = chars[0] if chars else ctx.current_focus
-    place_or_group = objects[0] if objects else (chars[0].name if chars and not ctx.current_focus else None)
+    focus = ctx.current_focus
+    char = chars[0] if chars else focus
     
     # If we got a character arg but current_focus exists, the arg is where they belong
-    if chars and ctx.current_focus and ctx.current_focus != chars[0]:
-        place_or_group = chars[0].name
-        char = ctx.current_focus
+    # (identity first: Character's dataclass __eq__ compares every field)
+    group_is_char = bool(chars and focus and focus is not chars[0] and focus != chars[0])
+    if group_is_char:
+        char = focus
     
     if char:
         char.Joy += 12
         char.Love += 8
         char.Sadness -= 5
     
-    # Catalyst - what started the journey
-    if catalyst:
-        catalyst_text = _event_to_phrase(catalyst)
-        if catalyst_text:
-            parts.append(f"{catalyst_text}.")
-    
-    # Process - how belonging was found
-    if process:
-        process_text = _event_to_phrase(process)
-        if process_text:
-            parts.append(f"{process_text}.")
-    
-    # Outcome - result of finding belonging
-    if outcome:
-        outcome_text = _event_to_phrase(outcome)
-        if outcome_text:
-            parts.append(f"{outcome_text}.")
+    # Catalyst (what started the journey), process (how belonging was
+    # found) and outcome (the result), each narrated as its own sentence
+    if kwargs:
+        for key in _BELONGING_EVENTS:
+            event = kwargs.get(key)
+            if event:
+                event_text = _event_to_phrase(event)
+                if event_text:
+                    parts.append(event_text + ".")
     
     if parts:
-        return StoryFragment(' '.join(parts), kernel_name="Belonging")
+        # Most calls narrate a single sentence; only join when there are more
+        text = parts[0] if len(parts) == 1 else ' '.join(parts)
+        return StoryFragment(text, kernel_name="Belonging")
     
     # Simple usage
-    if char and place_or_group:
-        return StoryFragment(f"{char.name} found a sense of belonging with {place_or_group}.")
-    elif char:
+    if char:
+        # If an object/group is passed as arg (like "Kids"), that's WHERE they belong, not WHO
+        if group_is_char:
+            place_or_group = chars[0].name
+        else:
+            objects = [a for a in args if type(a) is str]
+            place_or_group = objects[0] if objects else (chars[0].name if chars and not focus else None)
+        if place_or_group:
+            return StoryFragment(f"{char.name} found a sense of belonging with {place_or_group}.")
         return StoryFragment(f"{char.name} finally felt like they belonged.")
     
-    return StoryFragment("belonging", kernel_name="Belonging")
+    return _BELONGING_CONCEPT
 
 
-@REGISTRY.kernel("StayForever")
 def kernel_stay_forever(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Staying somewhere or with someone forever.
@@ -321,30 +333,31 @@ def kernel_stay_forever(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Represents commitment, permanence, or being unable to leave.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars = _chars_only(args)
     
     # Determine subject - prefer current_focus over explicit char arg
     # because in transformation contexts, the char arg is often WHERE they stay
-    char = ctx.current_focus if ctx.current_focus else (chars[0] if chars else None)
-    place_or_who = objects[0] if objects else (chars[0].name if chars and ctx.current_focus else None)
+    focus = ctx.current_focus
+    char = focus if focus else (chars[0] if chars else None)
     
     if char:
         char.Love += 5
         
+        objects = [a for a in args if type(a) is str]
+        place_or_who = objects[0] if objects else (chars[0].name if chars and focus else None)
+        
         if place_or_who:
             return StoryFragment(f"{char.name} decided to stay with {place_or_who} forever.")
         else:
             return StoryFragment(f"{char.name} stayed forever in that wonderful place.")
     
-    return StoryFragment("stay forever", kernel_name="StayForever")
+    return _STAY_FOREVER_CONCEPT
 
 
 # =============================================================================
 # OBJECTS & THINGS
 # =============================================================================
 
-@REGISTRY.kernel("Basket")
 def kernel_basket(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     A basket object - container for carrying things.
@@ -357,25 +370,16 @@ def kernel_basket(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Object in stories, often for carrying items or hiding in.
     """
-    objects = [str(a) for a in args if isinstance(a, str)]
-    
-    # Check for attributes
-    size = None
-    if 'tight' in kwargs or (objects and 'tight' in objects):
-        size = 'tight'
-    elif 'big' in kwargs or (objects and 'big' in objects):
-        size = 'big'
+    # Check for attributes, given either as keywords or as string args
+    candidates = set(kwargs)
+    candidates.update(a for a in args if type(a) is str)
+    size = 'tight' if 'tight' in candidates else 'big' if 'big' in candidates else None
     
     # Set as current object for context
-    if size:
-        ctx.current_object = f"{size} basket"
-        return StoryFragment(f"a {size} basket", kernel_name="Basket")
-    
-    ctx.current_object = "basket"
-    return StoryFragment("a basket", kernel_name="Basket")
+    fragment, ctx.current_object = _BASKETS[size]
+    return fragment
 
 
-@REGISTRY.kernel("Toys")
 def kernel_toys(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Toys - playthings for children.
@@ -387,13 +391,28 @@ def kernel_toys(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     Usage: Objects in stories about play and discovery.
     """
     ctx.current_object = "toys"
-    return StoryFragment("toys", kernel_name="Toys")
+    return _TOYS
 
 
 # =============================================================================
-# ADDITIONAL CHARACTER TYPES
+# REGISTRATION
 # =============================================================================
 
+# Registered in one pass, as in gen5k12; see KernelRegistry.register_table.
+_KERNELS: List[Tuple[str, Callable[..., StoryFragment]]] = [
+    ("Sorry", kernel_sorry),
+    ("HeadHang", kernel_headhang),
+    ("Comforted", kernel_comforted),
+    ("FamilySupport", kernel_family_support),
+    ("Restless", kernel_restless),
+    ("Belonging", kernel_belonging),
+    ("StayForever", kernel_stay_forever),
+    ("Basket", kernel_basket),
+    ("Toys", kernel_toys),
+]
+REGISTRY.register_table(_KERNELS)
+
+
 # =============================================================================
 # TEST RUNNER
 # =============================================================================
@@ -413,14 +432,14 @@ if __name__ == "__main__":
         'Basket', 'Toys', 'Kids', 'Lady'
     ]
     
-    implemented = [k for k in this_file_kernels if k in REG.kernels]
+    # One pass; keeps the pack's order for the report
+    missing = [k for k in this_file_kernels if k not in REG.kernels]
     
     print(f"✅ Kernels in this pack: {len(this_file_kernels)}")
-    print(f"✅ Successfully registered: {len(implemented)}")
+    print(f"✅ Successfully registered: {len(this_file_kernels) - len(missing)}")
     print(f"✅ Total kernels in registry: {len(REG.kernels)}")
     
-    if len(implemented) < len(this_file_kernels):
-        missing = [k for k in this_file_kernels if k not in REG.kernels]
+    if missing:
         print(f"\n⚠️  Not registered: {missing}")
     else:
         print(f"\n🎉 All kernels from this pack successfully registered!")
@@ -43,6 +43,8 @@ KERNELS IMPLEMENTED:
 All kernels follow the standard pattern with appropriate emotional state updates.
 """
 
+from typing import Callable, List, Tuple
+
 from gen5 import (
     REGISTRY,
     StoryContext,
@@ -52,14 +54,49 @@ from gen5 import (
     _to_phrase,
     _event_to_phrase,
     _get_default_actor,
+    _split_chars_strs,
+    _chars_only,
+    _name,
+    _join_names,
 )
 
 
+_join = NLGUtils.join_list
+
+
+# Constant fallback returns, built once and shared between calls
+_PARK_VISIT_CONCEPT = StoryFragment("a trip to the park", kernel_name="ParkVisit")
+_SAIL_CONCEPT = StoryFragment("sailing on the water", kernel_name="Sail")
+_DISLIKE_CONCEPT = StoryFragment("dislike", kernel_name="Dislike")
+_REJECTION_CONCEPT = StoryFragment("rejection", kernel_name="Rejection")
+_OBEDIENCE_CONCEPT = StoryFragment("obedience", kernel_name="Obedience")
+_CLAP_CONCEPT = StoryFragment("everyone clapped", kernel_name="Clap")
+_HANG_CONCEPT = StoryFragment("hung up", kernel_name="Hang")
+_DEMAND_CONCEPT = StoryFragment("a demand was made", kernel_name="Demand")
+_CONFRONT_CONCEPT = StoryFragment("a confrontation happened", kernel_name="Confront")
+_COVER_CONCEPT = StoryFragment("covered up", kernel_name="Cover")
+_SPRAY_CONCEPT = StoryFragment("the water was sprayed", kernel_name="Spray")
+_LOAD_CONCEPT = StoryFragment("loading up", kernel_name="Load")
+_BURN_CONCEPT = StoryFragment("something burned", kernel_name="Burn")
+_FEAST_CONCEPT = StoryFragment("a feast of delicious food", kernel_name="Feast")
+_DEPARTURE_CONCEPT = StoryFragment("it was time to leave", kernel_name="Departure")
+_DAMAGE_CONCEPT = StoryFragment("something got damaged", kernel_name="Damage")
+_TEST_CONCEPT = StoryFragment("a test was done", kernel_name="Test")
+_BORROW_CONCEPT = StoryFragment("the it was borrowed", kernel_name="Borrow")
+_SNACK_CONCEPT = StoryFragment("snack time", kernel_name="Snack")
+_ORDER_CONCEPT = StoryFragment("everything was put in order", kernel_name="Order")
+_APPEAR_CONCEPT = StoryFragment("something appeared", kernel_name="Appear")
+_INSTRUCTION_CONCEPT = StoryFragment("instructions were given", kernel_name="Instruction")
+_POSSESSION_CONCEPT = StoryFragment("possession of treasure", kernel_name="Possession")
+_PRINT_CONCEPT = StoryFragment("the picture was printed", kernel_name="Print")
+_PROMPT_CONCEPT = StoryFragment("there was a prompt", kernel_name="Prompt")
+_IF_CONCEPT = StoryFragment("if only", kernel_name="If")
+
+
 # =============================================================================
 # OUTDOOR ACTIVITIES
 # =============================================================================
 
-@REGISTRY.kernel("Picnic")
 def kernel_picnic(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Outdoor eating event in a pleasant setting.
@@ -71,8 +108,7 @@ def kernel_picnic(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Outdoor family/friend activity with food and fun.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     participants = kwargs.get('participants', chars)
     location = kwargs.get('location', 'park')
@@ -83,12 +119,15 @@ def kernel_picnic(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     # Get actor(s)
     if participants:
+        # One pass: cheer up the characters and collect every name
+        names = []
         for p in participants:
-            if isinstance(p, Character):
+            if type(p) is Character:
                 p.Joy += 8
-        
-        names = [p.name if isinstance(p, Character) else str(p) for p in participants]
-        names_str = NLGUtils.join_list(names)
+                names.append(p.name)
+            else:
+                names.append(str(p))
+        names_str = _join(names)
         parts.append(f"{names_str} had a lovely picnic at the {location}.")
     elif chars:
         char = chars[0]
@@ -99,13 +138,21 @@ def kernel_picnic(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     # Food details
     if food:
-        food_items = [str(f) for f in food] if hasattr(food, '__iter__') and not isinstance(food, str) else [str(food)]
-        parts.append(f"They ate {NLGUtils.join_list(food_items)}.")
+        # food is nearly always a list or a single string; check those first
+        t = type(food)
+        if t is list or t is tuple:
+            food_items = [str(f) for f in food]
+        elif t is str:
+            food_items = [food]
+        else:
+            food_items = [str(f) for f in food] if hasattr(food, '__iter__') and not isinstance(food, str) else [str(food)]
+        parts.append(f"They ate {_join(food_items)}.")
     
-    return StoryFragment(' '.join(parts), kernel_name="Picnic")
+    # Most calls narrate a single sentence; only join when there are more
+    text = parts[0] if len(parts) == 1 else ' '.join(parts)
+    return StoryFragment(text, kernel_name="Picnic")
 
 
-@REGISTRY.kernel("ParkVisit")
 def kernel_park_visit(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Going to the park for recreation.
@@ -117,8 +164,7 @@ def kernel_park_visit(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Catalyst for adventures, often leads to encounters and discoveries.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     place = kwargs.get('place', 'park')
     
@@ -127,17 +173,18 @@ def kernel_park_visit(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if char:
         char.Joy += 6
         if objects:
-            details = NLGUtils.join_list(objects)
+            details = _join(objects)
             return StoryFragment(f"{char.name} went to the {place} where there was {details}.")
         return StoryFragment(f"{char.name} went to the {place} to play.")
     
     if objects:
-        return StoryFragment(f"a visit to the {place} with {NLGUtils.join_list(objects)}", kernel_name="ParkVisit")
+        return StoryFragment(f"a visit to the {place} with {_join(objects)}", kernel_name="ParkVisit")
     
+    if place == 'park':
+        return _PARK_VISIT_CONCEPT
     return StoryFragment(f"a trip to the {place}", kernel_name="ParkVisit")
 
 
-@REGISTRY.kernel("Playday")
 def kernel_playday(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     A day spent playing.
@@ -149,7 +196,7 @@ def kernel_playday(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Frame for a story about playing, often with process and outcome.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     participants = kwargs.get('participants', chars)
     setting = kwargs.get('setting', 'outside')
@@ -160,12 +207,14 @@ def kernel_playday(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     # Get participants
     if participants:
+        names = []
         for p in participants:
-            if isinstance(p, Character):
+            if type(p) is Character:
                 p.Joy += 10
-        
-        names = [p.name if isinstance(p, Character) else str(p) for p in participants]
-        names_str = NLGUtils.join_list(names)
+                names.append(p.name)
+            else:
+                names.append(str(p))
+        names_str = _join(names)
         parts.append(f"{names_str} had a wonderful day playing {setting}.")
     elif chars:
         char = chars[0]
@@ -174,22 +223,18 @@ def kernel_playday(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     else:
         parts.append(f"It was a wonderful day of playing.")
     
-    # Process
-    if process:
-        process_text = _event_to_phrase(process)
-        if process_text:
-            parts.append(f"They {process_text}.")
+    # Process, then outcome
+    for event, template in ((process, "They %s."), (outcome, "%s.")):
+        if event:
+            event_text = _event_to_phrase(event)
+            if event_text:
+                parts.append(template % event_text)
     
-    # Outcome
-    if outcome:
-        outcome_text = _event_to_phrase(outcome)
-        if outcome_text:
-            parts.append(f"{outcome_text}.")
-    
-    return StoryFragment(' '.join(parts), kernel_name="Playday")
+    # Most calls narrate a single sentence; only join when there are more
+    text = parts[0] if len(parts) == 1 else ' '.join(parts)
+    return StoryFragment(text, kernel_name="Playday")
 
 
-@REGISTRY.kernel("Sail")
 def kernel_sail(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Sailing on water.
@@ -201,8 +246,7 @@ def kernel_sail(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Water-based activity, often with toy boats or adventures.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     vessel = objects[0] if objects else 'boat'
     location = kwargs.get('on', kwargs.get('location', 'water'))
@@ -216,8 +260,10 @@ def kernel_sail(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     # Multiple chars
     if len(chars) > 1:
         names = [c.name for c in chars]
-        return StoryFragment(f"{NLGUtils.join_list(names)} sailed on the {vessel}.")
+        return StoryFragment(f"{_join(names)} sailed on the {vessel}.")
     
+    if location == 'water':
+        return _SAIL_CONCEPT
     return StoryFragment(f"sailing on the {location}", kernel_name="Sail")
 
 
@@ -225,7 +271,6 @@ def kernel_sail(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
 # EMOTIONAL STATES & REACTIONS
 # =============================================================================
 
-@REGISTRY.kernel("Dislike")
 def kernel_dislike(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Not liking something or someone.
@@ -237,8 +282,7 @@ def kernel_dislike(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Expressing displeasure or aversion.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     obj = kwargs.get('object', objects[0] if objects else None)
     
@@ -255,10 +299,9 @@ def kernel_dislike(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if obj:
         return StoryFragment(f"disliked the {obj}", kernel_name="Dislike")
     
-    return StoryFragment("dislike", kernel_name="Dislike")
+    return _DISLIKE_CONCEPT
 
 
-@REGISTRY.kernel("Rejection")
 def kernel_rejection(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Being rejected or refusing someone.
@@ -270,8 +313,7 @@ def kernel_rejection(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Sad moment when someone is turned away or refused.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     rejected_thing = objects[0] if objects else None
@@ -289,11 +331,10 @@ def kernel_rejection(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if rejected_thing:
         return StoryFragment(f"there was rejection of {rejected_thing}", kernel_name="Rejection")
     
-    return StoryFragment("rejection", kernel_name="Rejection")
+    return _REJECTION_CONCEPT
 
 
-@REGISTRY.kernel("Obedience")
-def kernel_obedience(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_obedience(ctx: StoryContext, *args, rule=None, **kwargs) -> StoryFragment:
     """
     Following rules or instructions.
     
@@ -304,9 +345,7 @@ def kernel_obedience(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Positive behavior of following rules, often as a lesson.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    rule = kwargs.get('rule', None)
+    chars = _chars_only(args)
     
     char = chars[0] if chars else ctx.current_focus
     
@@ -314,18 +353,16 @@ def kernel_obedience(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         char.Joy += 3
         
         if rule:
-            rule_text = rule.name if isinstance(rule, Character) else str(rule)
-            return StoryFragment(f"{char.name} listened and obeyed {rule_text}.")
+            return StoryFragment(f"{char.name} listened and obeyed {_name(rule)}.")
         return StoryFragment(f"{char.name} was obedient and followed the rules.")
     
-    return StoryFragment("obedience", kernel_name="Obedience")
+    return _OBEDIENCE_CONCEPT
 
 
 # =============================================================================
 # ACTIONS & GESTURES
 # =============================================================================
 
-@REGISTRY.kernel("Clap")
 def kernel_clap(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Clapping hands in appreciation or rhythm.
@@ -337,7 +374,7 @@ def kernel_clap(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Celebration, applause, or rhythmic activity.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
     if chars:
         for char in chars:
@@ -346,13 +383,11 @@ def kernel_clap(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         if len(chars) == 1:
             return StoryFragment(f"{chars[0].name} clapped happily.")
         else:
-            names = [c.name for c in chars]
-            return StoryFragment(f"{NLGUtils.join_list(names)} clapped their hands.")
+            return StoryFragment(f"{_join_names([c.name for c in chars])} clapped their hands.")
     
-    return StoryFragment("everyone clapped", kernel_name="Clap")
+    return _CLAP_CONCEPT
 
 
-@REGISTRY.kernel("Hang")
 def kernel_hang(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Hanging something or hanging around.
@@ -364,8 +399,7 @@ def kernel_hang(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Physical action of suspending or being suspended.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     obj = objects[0] if objects else None
     
@@ -378,11 +412,10 @@ def kernel_hang(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     elif char:
         return StoryFragment(f"{char.name} hung on tight.")
     
-    return StoryFragment("hung up", kernel_name="Hang")
+    return _HANG_CONCEPT
 
 
-@REGISTRY.kernel("Demand")
-def kernel_demand(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_demand(ctx: StoryContext, *args, give=None, threat=None, **kwargs) -> StoryFragment:
     """
     Insistent request or requirement.
     
@@ -393,12 +426,9 @@ def kernel_demand(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Forceful asking, often leads to conflict.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
-    give = kwargs.get('give', None)
     fr = kwargs.get('from', None)
-    threat = kwargs.get('threat', None)
     
     char = chars[0] if chars else ctx.current_focus
     
@@ -414,11 +444,10 @@ def kernel_demand(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f'{char.name} demanded {objects[0]}.')
         return StoryFragment(f'{char.name} made a demand.')
     
-    return StoryFragment("a demand was made", kernel_name="Demand")
+    return _DEMAND_CONCEPT
 
 
-@REGISTRY.kernel("Confront")
-def kernel_confront(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_confront(ctx: StoryContext, *args, action=None, message=None, **kwargs) -> StoryFragment:
     """
     Facing someone or something directly.
     
@@ -429,30 +458,28 @@ def kernel_confront(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Brave act of standing up to someone/something.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    action = kwargs.get('action', None)
-    message = kwargs.get('message', None)
+    chars = _chars_only(args)
     
     if len(chars) >= 2:
-        chars[0].Fear -= 3
-        chars[0].Anger += 3
+        char = chars[0]
+        char.Fear -= 3
+        char.Anger += 3
         
+        name, other = char.name, chars[1].name
         if action:
-            return StoryFragment(f"{chars[0].name} confronted {chars[1].name} and {action}ed.")
+            return StoryFragment(f"{name} confronted {other} and {action}ed.")
         elif message:
-            return StoryFragment(f'{chars[0].name} confronted {chars[1].name} about {message}.')
-        return StoryFragment(f"{chars[0].name} bravely confronted {chars[1].name}.")
+            return StoryFragment(f'{name} confronted {other} about {message}.')
+        return StoryFragment(f"{name} bravely confronted {other}.")
     
     if chars:
         char = chars[0]
         char.Fear -= 3
         return StoryFragment(f"{char.name} stood up and confronted them.")
     
-    return StoryFragment("a confrontation happened", kernel_name="Confront")
+    return _CONFRONT_CONCEPT
 
 
-@REGISTRY.kernel("Cover")
 def kernel_cover(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Covering something up.
@@ -464,8 +491,7 @@ def kernel_cover(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Protection, hiding, or obscuring something.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     obj = objects[0] if objects else None
@@ -483,11 +509,10 @@ def kernel_cover(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         ctx.current_object = obj
         return StoryFragment(f"took cover under the {obj}", kernel_name="Cover")
     
-    return StoryFragment("covered up", kernel_name="Cover")
+    return _COVER_CONCEPT
 
 
-@REGISTRY.kernel("Spray")
-def kernel_spray(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_spray(ctx: StoryContext, *args, target=None, **kwargs) -> StoryFragment:
     """
     Spraying liquid or substance.
     
@@ -498,16 +523,13 @@ def kernel_spray(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Using spray bottle, or animal spraying (skunk).
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
-    
-    target = kwargs.get('target', None)
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     spray_with = objects[0] if objects else 'water'
     
     if target:
-        target_text = target.name if isinstance(target, Character) else str(target)
+        target_text = _name(target)
         if char:
             return StoryFragment(f"{char.name} sprayed the {target_text} with {spray_with}.")
         return StoryFragment(f"sprayed {target_text}", kernel_name="Spray")
@@ -515,10 +537,11 @@ def kernel_spray(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if char:
         return StoryFragment(f"{char.name} sprayed the {spray_with}.")
     
+    if not objects:
+        return _SPRAY_CONCEPT
     return StoryFragment(f"the {spray_with} was sprayed", kernel_name="Spray")
 
 
-@REGISTRY.kernel("Load")
 def kernel_load(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Loading items onto something.
@@ -530,8 +553,7 @@ def kernel_load(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Putting items onto a vehicle or container.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     
@@ -547,10 +569,9 @@ def kernel_load(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f"{char.name} loaded the {item}.")
         return StoryFragment(f"loaded the {item}", kernel_name="Load")
     
-    return StoryFragment("loading up", kernel_name="Load")
+    return _LOAD_CONCEPT
 
 
-@REGISTRY.kernel("Burn")
 def kernel_burn(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Something burning or getting burned.
@@ -562,8 +583,7 @@ def kernel_burn(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Accident involving fire or heat, often in cautionary tales.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     what = objects[0] if objects else None
     
@@ -581,14 +601,13 @@ def kernel_burn(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         char.Fear += 5
         return StoryFragment(f"{char.name} got burned!")
     
-    return StoryFragment("something burned", kernel_name="Burn")
+    return _BURN_CONCEPT
 
 
 # =============================================================================
 # EVENTS & SITUATIONS
 # =============================================================================
 
-@REGISTRY.kernel("Feast")
 def kernel_feast(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     A large celebratory meal.
@@ -600,20 +619,26 @@ def kernel_feast(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Reward or celebration with food.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     food = kwargs.get('food', objects[0] if objects else 'delicious food')
     participants = kwargs.get('participants', chars)
     
     if participants:
-        for p in participants:
-            if isinstance(p, Character):
+        names = []
+        if participants is chars:
+            # Defaulted to the Character args: no per-item type check needed
+            for p in chars:
                 p.Joy += 10
-        
-        names = [p.name if isinstance(p, Character) else str(p) for p in participants]
-        names_str = NLGUtils.join_list(names)
-        return StoryFragment(f"{names_str} enjoyed a wonderful feast of {food}.")
+                names.append(p.name)
+        else:
+            for p in participants:
+                if type(p) is Character:
+                    p.Joy += 10
+                    names.append(p.name)
+                else:
+                    names.append(str(p))
+        return StoryFragment(f"{_join_names(names)} enjoyed a wonderful feast of {food}.")
     
     char = chars[0] if chars else ctx.current_focus
     
@@ -621,11 +646,12 @@ def kernel_feast(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         char.Joy += 10
         return StoryFragment(f"{char.name} had a big feast of {food}.")
     
+    if food == 'delicious food':
+        return _FEAST_CONCEPT
     return StoryFragment(f"a feast of {food}", kernel_name="Feast")
 
 
-@REGISTRY.kernel("Departure")
-def kernel_departure(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_departure(ctx: StoryContext, *args, cause=None, farewell=None, **kwargs) -> StoryFragment:
     """
     Leaving or going away.
     
@@ -636,12 +662,7 @@ def kernel_departure(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Sad moment of parting, often followed by reunion.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    
-    cause = kwargs.get('cause', None)
-    farewell = kwargs.get('farewell', None)
-    
-    parts = []
+    chars = _chars_only(args)
     
     char = chars[0] if chars else ctx.current_focus
     
@@ -649,22 +670,21 @@ def kernel_departure(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         char.Sadness += 5
         
         if cause:
-            parts.append(f"{char.name} had to leave because of {cause}.")
+            leaving = f"{char.name} had to leave because of {cause}."
         else:
-            parts.append(f"It was time for {char.name} to go.")
+            leaving = f"It was time for {char.name} to go."
         
         if farewell:
-            parts.append(f"They said goodbye with {farewell}.")
+            goodbye = f"They said goodbye with {farewell}."
         else:
-            parts.append("They waved goodbye sadly.")
+            goodbye = "They waved goodbye sadly."
         
-        return StoryFragment(' '.join(parts), kernel_name="Departure")
+        return StoryFragment(leaving + " " + goodbye, kernel_name="Departure")
     
-    return StoryFragment("it was time to leave", kernel_name="Departure")
+    return _DEPARTURE_CONCEPT
 
 
-@REGISTRY.kernel("Damage")
-def kernel_damage(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_damage(ctx: StoryContext, *args, cause=None, **kwargs) -> StoryFragment:
     """
     Harm or injury to something.
     
@@ -675,10 +695,8 @@ def kernel_damage(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Result of accident, often leads to repair or sadness.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
-    cause = kwargs.get('cause', None)
     obj = objects[0] if objects else ctx.current_object
     
     char = chars[0] if chars else ctx.current_focus
@@ -691,11 +709,10 @@ def kernel_damage(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f"the {obj} was damaged by {cause}.")
         return StoryFragment(f"the {obj} got damaged.")
     
-    return StoryFragment("something got damaged", kernel_name="Damage")
+    return _DAMAGE_CONCEPT
 
 
-@REGISTRY.kernel("Performance")
-def kernel_performance(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_performance(ctx: StoryContext, *args, audience=None, **kwargs) -> StoryFragment:
     """
     A show or performance event.
     
@@ -705,35 +722,34 @@ def kernel_performance(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Music, plays, or shows being performed.
     """
-    chars = [a for a in args if isinstance(a, Character)]
+    chars = _chars_only(args)
     
-    stage = kwargs.get('stage', None)
-    audience = kwargs.get('audience', None)
     actors = kwargs.get('actors', chars)
-    content = kwargs.get('content', None)
-    
-    parts = []
     
     if actors:
-        for a in actors:
-            if isinstance(a, Character):
+        names = []
+        if actors is chars:
+            for a in chars:
                 a.Joy += 8
-        
-        names = [a.name if isinstance(a, Character) else str(a) for a in actors]
-        names_str = NLGUtils.join_list(names)
-        parts.append(f"{names_str} put on a wonderful performance!")
+                names.append(a.name)
+        else:
+            for a in actors:
+                if type(a) is Character:
+                    a.Joy += 8
+                    names.append(a.name)
+                else:
+                    names.append(str(a))
+        text = f"{_join_names(names)} put on a wonderful performance!"
     else:
-        parts.append("There was a wonderful performance!")
+        text = "There was a wonderful performance!"
     
     if audience:
-        aud_text = audience.name if isinstance(audience, Character) else str(audience)
-        parts.append(f"The {aud_text} watched and cheered.")
+        text = f"{text} The {_name(audience)} watched and cheered."
     
-    return StoryFragment(' '.join(parts), kernel_name="Performance")
+    return StoryFragment(text, kernel_name="Performance")
 
 
-@REGISTRY.kernel("Test")
-def kernel_test(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_test(ctx: StoryContext, *args, target=None, **kwargs) -> StoryFragment:
     """
     Testing or trying something out.
     
@@ -744,10 +760,7 @@ def kernel_test(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Trying something to see if it works.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
-    
-    target = kwargs.get('target', None)
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     obj = objects[0] if objects else ctx.current_object
@@ -759,17 +772,16 @@ def kernel_test(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         return StoryFragment(f"the {obj} was tested", kernel_name="Test")
     
     if target:
-        target_text = target.name if isinstance(target, Character) else str(target)
+        target_text = _name(target)
         return StoryFragment(f"it was time to test {target_text}", kernel_name="Test")
     
-    return StoryFragment("a test was done", kernel_name="Test")
+    return _TEST_CONCEPT
 
 
 # =============================================================================
 # SOCIAL INTERACTIONS
 # =============================================================================
 
-@REGISTRY.kernel("Borrow")
 def kernel_borrow(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Borrowing something from someone.
@@ -781,26 +793,26 @@ def kernel_borrow(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Taking something temporarily with permission.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     lender = kwargs.get('lender', kwargs.get('from', None))
     borrower = kwargs.get('borrower', chars[0] if chars else ctx.current_focus)
     item = objects[0] if objects else 'it'
     
     if borrower and lender:
-        borrower_name = borrower.name if isinstance(borrower, Character) else str(borrower)
-        lender_name = lender.name if isinstance(lender, Character) else str(lender)
+        borrower_name = _name(borrower)
+        lender_name = _name(lender)
         return StoryFragment(f"{borrower_name} borrowed the {item} from {lender_name}.")
     
     if borrower:
-        borrower_name = borrower.name if isinstance(borrower, Character) else str(borrower)
+        borrower_name = _name(borrower)
         return StoryFragment(f"{borrower_name} borrowed the {item}.")
     
+    if not objects:
+        return _BORROW_CONCEPT
     return StoryFragment(f"the {item} was borrowed", kernel_name="Borrow")
 
 
-@REGISTRY.kernel("Snack")
 def kernel_snack(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     A small meal or treat.
@@ -812,8 +824,7 @@ def kernel_snack(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Small food items, often shared or discovered.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     foods = objects if objects else ['snack']
@@ -821,16 +832,15 @@ def kernel_snack(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if char:
         char.Joy += 4
         if len(foods) > 1:
-            return StoryFragment(f"{char.name} had a snack of {NLGUtils.join_list(foods)}.")
+            return StoryFragment(f"{char.name} had a snack of {_join_names(foods)}.")
         return StoryFragment(f"{char.name} had a yummy {foods[0]}.")
     
     if objects:
-        return StoryFragment(f"a snack of {NLGUtils.join_list(objects)}", kernel_name="Snack")
+        return StoryFragment(f"a snack of {_join_names(objects)}", kernel_name="Snack")
     
-    return StoryFragment("snack time", kernel_name="Snack")
+    return _SNACK_CONCEPT
 
 
-@REGISTRY.kernel("Order")
 def kernel_order(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Ordering (food, commands, or arrangement).
@@ -842,8 +852,7 @@ def kernel_order(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Ordering food at restaurant or arranging things.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     item = objects[0] if objects else None
@@ -856,10 +865,9 @@ def kernel_order(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
         return StoryFragment(f"ordered {item}", kernel_name="Order")
     
     # Order as arrangement
-    return StoryFragment("everything was put in order", kernel_name="Order")
+    return _ORDER_CONCEPT
 
 
-@REGISTRY.kernel("Appear")
 def kernel_appear(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Something or someone appearing.
@@ -871,8 +879,7 @@ def kernel_appear(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Sudden appearance, often surprising.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     location = objects[0] if objects else None
     
@@ -888,10 +895,9 @@ def kernel_appear(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
             return StoryFragment(f"The {obj} appeared on the {objects[1]}!")
         return StoryFragment(f"The {obj} appeared!", kernel_name="Appear")
     
-    return StoryFragment("something appeared", kernel_name="Appear")
+    return _APPEAR_CONCEPT
 
 
-@REGISTRY.kernel("Instruction")
 def kernel_instruction(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Giving or receiving instructions.
@@ -903,25 +909,23 @@ def kernel_instruction(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Teaching, explaining, or directing someone.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     
     if char and objects:
-        topic = NLGUtils.join_list(objects)
+        topic = _join_names(objects)
         return StoryFragment(f"{char.name} gave instructions about {topic}.")
     
     if objects:
-        return StoryFragment(f"instructions about {NLGUtils.join_list(objects)}", kernel_name="Instruction")
+        return StoryFragment(f"instructions about {_join_names(objects)}", kernel_name="Instruction")
     
     if char:
         return StoryFragment(f"{char.name} gave careful instructions.")
     
-    return StoryFragment("instructions were given", kernel_name="Instruction")
+    return _INSTRUCTION_CONCEPT
 
 
-@REGISTRY.kernel("Possession")
 def kernel_possession(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Owning or having something.
@@ -933,8 +937,7 @@ def kernel_possession(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: State of owning something, often cherished items.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     item = objects[0] if objects else 'treasure'
@@ -942,10 +945,11 @@ def kernel_possession(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if char:
         return StoryFragment(f"{char.name} had a special {item}.")
     
+    if not objects:
+        return _POSSESSION_CONCEPT
     return StoryFragment(f"possession of {item}", kernel_name="Possession")
 
 
-@REGISTRY.kernel("Print")
 def kernel_print(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Printing something (picture, document).
@@ -957,8 +961,7 @@ def kernel_print(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Using a printer to make copies or images.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     item = objects[0] if objects else 'picture'
@@ -966,11 +969,12 @@ def kernel_print(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if char:
         return StoryFragment(f"{char.name} printed a {item}.")
     
+    if not objects:
+        return _PRINT_CONCEPT
     return StoryFragment(f"the {item} was printed", kernel_name="Print")
 
 
-@REGISTRY.kernel("Prompt")
-def kernel_prompt(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+def kernel_prompt(ctx: StoryContext, *args, question=None, **kwargs) -> StoryFragment:
     """
     Prompting or encouraging action.
     
@@ -981,10 +985,7 @@ def kernel_prompt(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Encouraging someone to do or say something.
     """
-    chars = [a for a in args if isinstance(a, Character)]
-    objects = [str(a) for a in args if isinstance(a, str)]
-    
-    question = kwargs.get('question', None)
+    chars, objects = _split_chars_strs(args)
     
     char = chars[0] if chars else ctx.current_focus
     action = objects[0] if objects else None
@@ -998,10 +999,9 @@ def kernel_prompt(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     if char:
         return StoryFragment(f"{char.name} gave a gentle prompt.")
     
-    return StoryFragment("there was a prompt", kernel_name="Prompt")
+    return _PROMPT_CONCEPT
 
 
-@REGISTRY.kernel("If")
 def kernel_if(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     """
     Conditional statement or situation.
@@ -1013,24 +1013,62 @@ def kernel_if(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
     
     Usage: Expressing conditions and consequences.
     """
-    args_list = list(args)
-    
     # Try to identify condition and consequence
-    if len(args_list) >= 2:
-        condition = args_list[0]
-        consequence = args_list[1]
+    if len(args) >= 2:
+        condition = args[0]
+        consequence = args[1]
         
-        cond_text = _event_to_phrase(condition) if not isinstance(condition, str) else condition
-        cons_text = _event_to_phrase(consequence) if not isinstance(consequence, str) else consequence
+        cond_text = condition if type(condition) is str else _event_to_phrase(condition)
+        cons_text = consequence if type(consequence) is str else _event_to_phrase(consequence)
         
         if cond_text and cons_text:
             return StoryFragment(f"if {cond_text}, then {cons_text}", kernel_name="If")
     
-    if args_list:
-        text = _event_to_phrase(args_list[0]) if not isinstance(args_list[0], str) else str(args_list[0])
+    if args:
+        first = args[0]
+        text = first if type(first) is str else _event_to_phrase(first)
         return StoryFragment(f"if only {text}", kernel_name="If")
     
-    return StoryFragment("if only", kernel_name="If")
+    return _IF_CONCEPT
+
+
+# =============================================================================
+# REGISTRATION
+# =============================================================================
+
+# Registered in one pass, as in gen5k12; see KernelRegistry.register_table.
+_KERNELS: List[Tuple[str, Callable[..., StoryFragment]]] = [
+    ("Picnic", kernel_picnic),
+    ("ParkVisit", kernel_park_visit),
+    ("Playday", kernel_playday),
+    ("Sail", kernel_sail),
+    ("Dislike", kernel_dislike),
+    ("Rejection", kernel_rejection),
+    ("Obedience", kernel_obedience),
+    ("Clap", kernel_clap),
+    ("Hang", kernel_hang),
+    ("Demand", kernel_demand),
+    ("Confront", kernel_confront),
+    ("Cover", kernel_cover),
+    ("Spray", kernel_spray),
+    ("Load", kernel_load),
+    ("Burn", kernel_burn),
+    ("Feast", kernel_feast),
+    ("Departure", kernel_departure),
+    ("Damage", kernel_damage),
+    ("Performance", kernel_performance),
+    ("Test", kernel_test),
+    ("Borrow", kernel_borrow),
+    ("Snack", kernel_snack),
+    ("Order", kernel_order),
+    ("Appear", kernel_appear),
+    ("Instruction", kernel_instruction),
+    ("Possession", kernel_possession),
+    ("Print", kernel_print),
+    ("Prompt", kernel_prompt),
+    ("If", kernel_if),
+]
+REGISTRY.register_table(_KERNELS)
 
 
 # =============================================================================
@@ -1054,14 +1092,14 @@ if __name__ == "__main__":
         'Possession', 'Burn'
     ]
     
-    implemented = [k for k in this_file_kernels if k in REG.kernels]
+    # One pass; keeps the pack's order for the report
+    missing = [k for k in this_file_kernels if k not in REG.kernels]
     
     print(f"✅ Kernels in this pack: {len(this_file_kernels)}")
-    print(f"✅ Successfully registered: {len(implemented)}")
+    print(f"✅ Successfully registered: {len(this_file_kernels) - len(missing)}")
     print(f"✅ Total kernels in registry: {len(REG.kernels)}")
     
-    if len(implemented) < len(this_file_kernels):
-        missing = [k for k in this_file_kernels if k not in REG.kernels]
+    if missing:
         print(f"\n⚠️  Not registered: {missing}")
     else:
         print(f"\n🎉 All kernels from this pack successfully registered!")
@@ -2,7 +2,9 @@
 gen5registry.py - Central registry that loads all kernel packs.
 
 This module auto-discovers and imports all gen5kXX.py and char5kXX.py kernel packs,
-registering their kernels into the shared REGISTRY.
+registering their kernels into the shared REGISTRY. Packs are loaded lazily, on
+first access to REGISTRY or to one of the helpers below, so importing this module
+for its re-exports does not pay for importing every pack.
 
 Usage:
     from gen5registry import REGISTRY, generate_story
@@ -15,9 +17,9 @@ import importlib
 import sys
 from pathlib import Path
 
-# Import the base gen5 module
+# Import the base gen5 module; REGISTRY itself is served by __getattr__ below
+import gen5
 from gen5 import (
-    REGISTRY,
     KernelExecutor,
     StoryContext,
     StoryFragment,
@@ -31,6 +33,7 @@ from gen5 import (
 
 # Auto-discover and load all kernel packs
 _loaded_packs = []
+_packs_loaded = False
 
 def _load_kernel_packs():
     """Discover and import all gen5kXX.py and char5kXX.py kernel pack modules."""
@@ -39,25 +42,13 @@ def _load_kernel_packs():
     # Get the directory containing this file
     base_dir = Path(__file__).parent
     
-    # Find all gen5kXX.py files (gen5k01.py through gen5k99.py)
-    for i in range(1, 100):
-        module_name = f"gen5k{i:02d}"
-        module_path = base_dir / f"{module_name}.py"
-        
-        if module_path.exists():
-            try:
-                # Import the module (this registers its kernels via decorators)
-                importlib.import_module(module_name)
-                _loaded_packs.append(module_name)
-            except Exception as e:
-                print(f"Warning: Failed to load {module_name}: {e}")
-    
-    # Find all char5kXX.py files (char5k01.py through char5k99.py)
-    for i in range(1, 100):
-        module_name = f"char5k{i:02d}"
-        module_path = base_dir / f"{module_name}.py"
-        
-        if module_path.exists():
+    # Find all gen5kXX.py files, then all char5kXX.py files (XX in 01..99).
+    # One directory scan per prefix; sorting keeps the numeric load order.
+    for prefix in ("gen5k", "char5k"):
+        for module_path in sorted(base_dir.glob(f"{prefix}[0-9][0-9].py")):
+            module_name = module_path.stem
+            if module_name.endswith("00"):
+                continue
             try:
                 # Import the module (this registers its kernels via decorators)
                 importlib.import_module(module_name)
@@ -65,25 +56,40 @@ def _load_kernel_packs():
             except Exception as e:
                 print(f"Warning: Failed to load {module_name}: {e}")
 
-# Load all packs on import
-_load_kernel_packs()
+def ensure_packs_loaded():
+    """Load all kernel packs on first call; later calls return immediately."""
+    global _packs_loaded
+    if not _packs_loaded:
+        _packs_loaded = True
+        _load_kernel_packs()
+
+def __getattr__(name):
+    # `from gen5registry import REGISTRY` loads the packs before handing it out
+    if name == 'REGISTRY':
+        ensure_packs_loaded()
+        return gen5.REGISTRY
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def generate_story(kernel: str) -> str:
     """Generate a story from a kernel string using the full registry."""
-    executor = KernelExecutor(REGISTRY)
+    ensure_packs_loaded()
+    executor = KernelExecutor(gen5.REGISTRY)
     return executor.execute(kernel)
 
 def get_kernel_count() -> int:
     """Return the total number of registered kernels."""
-    return len(REGISTRY.kernels)
+    ensure_packs_loaded()
+    return len(gen5.REGISTRY.kernels)
 
 def list_loaded_packs() -> list:
     """Return list of loaded kernel pack module names."""
+    ensure_packs_loaded()
     return ['gen5'] + _loaded_packs
 
 def list_kernels() -> list:
     """Return sorted list of all registered kernel names."""
-    return sorted(REGISTRY.kernels.keys())
+    ensure_packs_loaded()
+    return sorted(gen5.REGISTRY.kernels.keys())
 
 
 if __name__ == "__main__":
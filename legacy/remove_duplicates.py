@@ -8,10 +8,15 @@ Keeps better implementations based on:
 """
 
 import re
+import sys
 import ast
+from bisect import bisect_right
 from pathlib import Path
 from collections import defaultdict
 
+# @REGISTRY.kernel("KernelName") decorators, anywhere on a line
+DECORATOR_RE = re.compile(r'@REGISTRY\.kernel\(["\'](\w+)["\']\)')
+
 # Collect all kernel registrations
 duplicates = defaultdict(list)
 
@@ -34,35 +39,45 @@ def extract_kernels_from_file(filepath):
             content = f.read()
             lines = content.split('\n')
             
-        # Find all @REGISTRY.kernel("KernelName") decorators
-        pattern = r'@REGISTRY\.kernel\(["\'](\w+)["\']\)'
-        for i, line in enumerate(lines, 1):
-            match = re.search(pattern, line)
-            if match:
-                kernel_name = match.group(1)
-                # Find the function definition
-                func_start = i
-                func_end = i + 1
-                # Scan ahead to find the end of the function
-                indent_level = None
-                for j in range(i, min(i + 100, len(lines))):
-                    if lines[j].strip().startswith('def '):
-                        # This is the function start
-                        func_start = j + 1
-                        indent_level = len(lines[j]) - len(lines[j].lstrip())
-                    elif indent_level is not None and lines[j].strip() and not lines[j].startswith(' ' * (indent_level + 1)):
-                        func_end = j
-                        break
-                
-                func_lines = lines[func_start-1:func_end]
-                kernels.append({
-                    'name': kernel_name,
-                    'line': i,
-                    'func_start': func_start,
-                    'func_end': func_end,
-                    'code': '\n'.join(func_lines),
-                    'length': len(func_lines)
-                })
+        # Find all @REGISTRY.kernel("KernelName") decorators in one scan of
+        # the whole file; line numbers come from the match offsets
+        line_starts = [0]
+        line_starts.extend(m.end() for m in re.finditer('\n', content))
+        # Per-line stripped text, indentation and leading-space count, computed
+        # once per file instead of once per line per decorator scanned
+        stripped = [line.strip() for line in lines]
+        indents = [len(line) - len(line.lstrip()) for line in lines]
+        spaces = [len(line) - len(line.lstrip(' ')) for line in lines]
+        last_line = 0
+        for match in DECORATOR_RE.finditer(content):
+            i = bisect_right(line_starts, match.start())
+            if i == last_line:
+                continue  # only the first decorator on a line counts
+            last_line = i
+            kernel_name = match.group(1)
+            # Find the function definition
+            func_start = i
+            func_end = i + 1
+            # Scan ahead to find the end of the function
+            indent_level = None
+            for j in range(i, min(i + 100, len(lines))):
+                if stripped[j].startswith('def '):
+                    # This is the function start
+                    func_start = j + 1
+                    indent_level = indents[j]
+                elif indent_level is not None and stripped[j] and spaces[j] <= indent_level:
+                    func_end = j
+                    break
+            
+            func_lines = lines[func_start-1:func_end]
+            kernels.append({
+                'name': kernel_name,
+                'line': i,
+                'func_start': func_start,
+                'func_end': func_end,
+                'code': '\n'.join(func_lines),
+                'length': len(func_lines)
+            })
     except Exception as e:
         print(f"Error reading {filepath}: {e}")
     
@@ -87,41 +102,45 @@ for kfile in kernel_files:
 # Find actual duplicates
 dup_kernels = {k: v for k, v in duplicates.items() if len(v) > 1}
 
-print(f"Found {len(dup_kernels)} duplicate kernels:\n")
+# The report is collected line by line and written out in one call at the end
+out = []
+emit = out.append
+
+emit(f"Found {len(dup_kernels)} duplicate kernels:\n")
 
 # Create removal plan
 to_remove = []
 
 for kernel_name, locations in sorted(dup_kernels.items()):
-    print(f"\n{'='*70}")
-    print(f"Kernel: {kernel_name}")
-    print(f"{'='*70}")
+    emit(f"\n{'='*70}")
+    emit(f"Kernel: {kernel_name}")
+    emit(f"{'='*70}")
     
     # Show all locations
     for i, loc in enumerate(locations):
-        print(f"\n  [{i+1}] {loc['file']}:{loc['line']} (lines: {loc['func_start']}-{loc['func_end']}, length: {loc['length']})")
+        emit(f"\n  [{i+1}] {loc['file']}:{loc['line']} (lines: {loc['func_start']}-{loc['func_end']}, length: {loc['length']})")
     
     # Decision logic: keep gen5.py if it exists, otherwise keep the last one
     gen5_loc = [loc for loc in locations if loc['file'] == 'gen5.py']
     
     if gen5_loc:
         keep = gen5_loc[0]
-        print(f"\n  ✓ KEEP: {keep['file']} (reference implementation)")
+        emit(f"\n  ✓ KEEP: {keep['file']} (reference implementation)")
         for loc in locations:
             if loc['file'] != 'gen5.py':
                 to_remove.append((kernel_name, loc))
-                print(f"  ✗ REMOVE: {loc['file']}:{loc['line']}")
+                emit(f"  ✗ REMOVE: {loc['file']}:{loc['line']}")
     else:
         # Keep the most recent (last in list, which is usually the most refined)
         keep = locations[-1]
-        print(f"\n  ✓ KEEP: {keep['file']} (latest implementation)")
+        emit(f"\n  ✓ KEEP: {keep['file']} (latest implementation)")
         for loc in locations[:-1]:
             to_remove.append((kernel_name, loc))
-            print(f"  ✗ REMOVE: {loc['file']}:{loc['line']}")
+            emit(f"  ✗ REMOVE: {loc['file']}:{loc['line']}")
 
-print(f"\n\n{'='*70}")
-print(f"SUMMARY: {len(to_remove)} kernel definitions to remove")
-print(f"{'='*70}\n")
+emit(f"\n\n{'='*70}")
+emit(f"SUMMARY: {len(to_remove)} kernel definitions to remove")
+emit(f"{'='*70}\n")
 
 # Group by file for easier removal
 by_file = defaultdict(list)
@@ -129,11 +148,12 @@ for kernel_name, loc in to_remove:
     by_file[loc['file']].append((kernel_name, loc['func_start'], loc['func_end']))
 
 for file, removals in sorted(by_file.items()):
-    print(f"\n{file}: {len(removals)} kernels to remove")
+    emit(f"\n{file}: {len(removals)} kernels to remove")
     for kernel_name, start, end in sorted(removals, key=lambda x: x[1], reverse=True):
-        print(f"  - {kernel_name} (lines {start}-{end})")
+        emit(f"  - {kernel_name} (lines {start}-{end})")
 
-print("\n" + "="*70)
-print("Ready to remove duplicates? (This script just analyzed)")
-print("="*70)
+emit("\n" + "="*70)
+emit("Ready to remove duplicates? (This script just analyzed)")
+emit("="*70)
 
+sys.stdout.write("\n".join(out) + "\n")
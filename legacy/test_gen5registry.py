@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+test_gen5registry.py - Tests for kernel registration and lazy pack loading.
+
+Covers KernelRegistry.register_table / _warn_duplicate (as used by the
+gen5k12-k14 packs) and the lazy REGISTRY access path of gen5registry.
+
+Run from this directory:
+    python -m unittest test_gen5registry
+"""
+
+import contextlib
+import importlib
+import io
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+LEGACY_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(LEGACY_DIR))
+
+from gen5 import KernelRegistry, StoryContext, StoryFragment
+
+
+def _first(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+    """First implementation."""
+    return StoryFragment("first")
+
+
+def _second(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+    """Second implementation."""
+    return StoryFragment("second")
+
+
+def _third(ctx: StoryContext, *args, **kwargs) -> StoryFragment:
+    """Third implementation."""
+    return StoryFragment("third")
+
+
+def _register(registry: KernelRegistry, table) -> str:
+    """register_table with stdout captured; returns what it printed."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        registry.register_table(table)
+    return out.getvalue()
+
+
+class RegisterTableTest(unittest.TestCase):
+
+    def test_registers_in_table_order(self):
+        registry = KernelRegistry()
+        printed = _register(registry, [("B", _first), ("A", _second), ("C", _third)])
+
+        self.assertEqual(printed, "")
+        self.assertEqual(list(registry.kernels), ["B", "A", "C"])
+        self.assertIs(registry.kernels["A"], _second)
+        self.assertEqual(registry.metadata["B"], {'verb': 'b', 'doc': _first.__doc__})
+
+    def test_later_tables_append_after_earlier_ones(self):
+        registry = KernelRegistry()
+        _register(registry, [("B", _first)])
+        _register(registry, [("A", _second)])
+
+        self.assertEqual(list(registry.kernels), ["B", "A"])
+
+    def test_duplicate_name_warns_and_overwrites(self):
+        registry = KernelRegistry()
+        _register(registry, [("Hug", _first)])
+        printed = _register(registry, [("Hug", _second)])
+
+        self.assertIn("Duplicate kernel 'Hug'", printed)
+        self.assertIn(__file__, printed)
+        self.assertIs(registry.kernels["Hug"], _second)
+        self.assertEqual(registry.metadata["Hug"]["doc"], _second.__doc__)
+        # Overwriting keeps the name's original position
+        self.assertEqual(list(registry.kernels), ["Hug"])
+
+    def test_duplicate_within_one_table_last_wins(self):
+        registry = KernelRegistry()
+        printed = _register(registry, [("Hug", _first), ("Kiss", _second), ("Hug", _third)])
+
+        self.assertEqual(printed.count("Duplicate kernel"), 1)
+        self.assertIn("Duplicate kernel 'Hug'", printed)
+        self.assertIs(registry.kernels["Hug"], _third)
+        self.assertEqual(list(registry.kernels), ["Hug", "Kiss"])
+
+    def test_matches_decorator_bookkeeping(self):
+        by_table = KernelRegistry()
+        _register(by_table, [("Hug", _first)])
+
+        by_decorator = KernelRegistry()
+        by_decorator.kernel("Hug")(_first)
+
+        self.assertEqual(by_table.kernels, by_decorator.kernels)
+        self.assertEqual(by_table.metadata, by_decorator.metadata)
+
+        # The decorator path reports duplicates the same way
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            by_decorator.kernel("Hug")(_second)
+        self.assertIn("Duplicate kernel 'Hug'", out.getvalue())
+
+
+class PackTablesTest(unittest.TestCase):
+
+    def test_pack_tables_are_registered_in_order(self):
+        import gen5registry
+        registry = gen5registry.REGISTRY
+        position = {name: i for i, name in enumerate(registry.kernels)}
+
+        for module_name in ("gen5k12", "gen5k13", "gen5k14"):
+            with self.subTest(pack=module_name):
+                table = importlib.import_module(module_name)._KERNELS
+                names = [name for name, _ in table]
+                self.assertEqual(len(names), len(set(names)))
+                for name, func in table:
+                    self.assertIs(registry.kernels[name], func)
+                    self.assertEqual(registry.metadata[name]['doc'], func.__doc__)
+                positions = [position[name] for name in names]
+                self.assertEqual(positions, sorted(positions))
+
+
+# Runs in a fresh interpreter so that no pack is already in sys.modules
+_LAZY_LOAD_SCRIPT = r'''
+import sys
+from pathlib import Path
+import gen5registry
+
+base_dir = Path(gen5registry.__file__).parent
+packs = sorted(p.stem for p in base_dir.glob("gen5k[0-9][0-9].py"))
+packs += sorted(p.stem for p in base_dir.glob("char5k[0-9][0-9].py"))
+assert packs, "no kernel packs found"
+assert not [m for m in packs if m in sys.modules], "packs imported eagerly"
+
+calls = []
+load = gen5registry._load_kernel_packs
+def counting_load():
+    calls.append(1)
+    load()
+gen5registry._load_kernel_packs = counting_load
+
+registry = gen5registry.REGISTRY
+assert [m for m in packs if m not in sys.modules] == [], "packs missing after REGISTRY access"
+
+from gen5registry import REGISTRY
+import gen5
+assert REGISTRY is registry is gen5.REGISTRY
+count = gen5registry.get_kernel_count()
+gen5registry.list_kernels()
+gen5registry.ensure_packs_loaded()
+assert gen5registry.get_kernel_count() == count == len(registry.kernels)
+
+assert len(calls) == 1, calls
+assert gen5registry.list_loaded_packs() == ["gen5"] + packs, gen5registry.list_loaded_packs()
+print("OK", count)
+'''
+
+
+class LazyPackLoadingTest(unittest.TestCase):
+
+    def test_registry_access_loads_every_pack_once(self):
+        result = subprocess.run(
+            [sys.executable, "-c", _LAZY_LOAD_SCRIPT],
+            cwd=LEGACY_DIR, capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("Duplicate kernel", result.stdout)
+        self.assertNotIn("Failed to load", result.stdout)
+        self.assertIn("OK ", result.stdout)
+
+    def test_unknown_attribute_still_raises(self):
+        import gen5registry
+        with self.assertRaises(AttributeError):
+            gen5registry.NOT_A_REGISTRY
+
+
+if __name__ == "__main__":
+    unittest.main()